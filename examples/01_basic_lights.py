@@ -3,8 +3,24 @@
 # Run this program to see different lighting effects
 
 import gbebox
+import micropython
 import time
 
+
+# The @micropython.native decorator compiles this function to machine code
+# instead of bytecode, so the loop arithmetic runs several times faster.
+# That matters for smooth fades and pixel-by-pixel animations.
+@micropython.native
+def sunrise(light):
+    """Gradually ramp the lights through sunrise colors."""
+    for brightness in range(0, 60, 5):  # Gradually increase from 0 to 60
+        # Mix red, orange, and white for sunrise colors
+        # (half as much green as red gives an orange tint)
+        light.rgbw(brightness, brightness >> 1, 0, brightness)
+        print(f"Brightness level: {brightness}")
+        time.sleep(1)  # Wait 1 second between changes
+
+
 print("Starting LED control example...")
 
 # Turn on the status LED to show the program is running
@@ -41,15 +57,7 @@ time.sleep(2)
 
 # Example 6: Create a simple sunrise effect
 print("6. Creating sunrise effect...")
-for brightness in range(0, 60, 5):  # Gradually increase from 0 to 60
-    # Mix red, yellow, and white for sunrise colors
-    red_amount = brightness
-    green_amount = brightness // 2  # Half as much green for orange tint
-    white_amount = brightness
-    
-    gbebox.light.rgbw(red_amount, green_amount, 0, white_amount)
-    print(f"Brightness level: {brightness}")
-    time.sleep(1)  # Wait 1 second between changes
+sunrise(gbebox.light)  # Runs the native-compiled ramp defined above
 
 print("7. Returning to soft white light...")
 gbebox.light.on()  # Back to default soft white
@@ -5,112 +5,135 @@
 import gbebox
 import time
 
+# Set DEBUG to False to silence the per-reading serial output. Printing is
+# surprisingly slow (every character goes out over the serial port), so
+# turning it off helps on long unattended runs.
+DEBUG = True
+
 print("Starting sensor reading example...")
 print("This program will read sensors every 5 seconds. Press Ctrl+C to stop.")
 
 # Turn on blue status LED to show program is running
 gbebox.indicator.on("blue")
 
+# Band tables for describing CO2 and light readings. Each entry is an
+# upper limit paired with its description. Scanning a table built once at
+# startup avoids rebuilding four message strings on every reading cycle.
+CO2_BANDS = (
+    (400, "  (Excellent air quality)"),
+    (800, "  (Good air quality)"),
+    (1200, "  (Moderate air quality - consider ventilation)"),
+    (99999, "  (Poor air quality - ventilation needed)"),
+)
+
+LUX_BANDS = (
+    (10, "  (Very dark)"),
+    (100, "  (Room lighting)"),
+    (1000, "  (Bright indoor lighting)"),
+    (999999, "  (Very bright - outdoor level)"),
+)
+
 # Counter to track how many readings we've taken
 reading_count = 0
 
 while True:  # Run forever until stopped
     reading_count += 1
-    print(f"\n--- Sensor Reading #{reading_count} ---")
-    
-    # Temperature reading (priority: SHT35 > MPL3115A2 > SCD4x > Seesaw)
-    temp = gbebox.sensor.temperature()
-    if temp is not None:  # Check if sensor gave us a valid reading
-        print(f"Temperature: {temp}°C")
-        # Show which sensor provided the reading
-        print(f"  (from {gbebox.sensor.temperature.device} sensor)")
-    else:
-        print("Temperature: No sensor connected")
-    
-    # Humidity reading (priority: SHT35 > SCD4x)
-    humidity = gbebox.sensor.humidity()
-    if humidity is not None:
-        print(f"Humidity: {humidity}%")
-        print(f"  (from {gbebox.sensor.humidity.device} sensor)")
-    else:
-        print("Humidity: No sensor connected")
-    
-    # CO2 reading (from SCD4x sensor only)
-    co2 = gbebox.sensor.co2()
-    if co2 is not None:
-        print(f"CO2: {co2} ppm")
-        # Provide context about CO2 levels
-        if co2 < 400:
-            print("  (Excellent air quality)")
-        elif co2 < 800:
-            print("  (Good air quality)")
-        elif co2 < 1200:
-            print("  (Moderate air quality - consider ventilation)")
+
+    # Read every sensor once in a single pass. The snapshot caches the
+    # values, so the checks below reuse them with no extra I2C traffic.
+    snap = gbebox.sensor.read_all()
+
+    # Formatting and printing every reading takes real time on the serial
+    # port, so all of the display work can be switched off at once.
+    if DEBUG:
+        print(f"\n--- Sensor Reading #{reading_count} ---")
+
+        # Temperature reading (priority: SHT35 > MPL3115A2 > SCD4x > Seesaw)
+        temp = snap.temperature
+        if temp is not None:  # Check if sensor gave us a valid reading
+            print(f"Temperature: {temp}°C")
+            # Show which sensor provided the reading
+            print(f"  (from {gbebox.sensor.temperature.device} sensor)")
         else:
-            print("  (Poor air quality - ventilation needed)")
-    else:
-        print("CO2: No sensor connected")
-    
-    # Atmospheric pressure (from MPL3115A2 sensor)
-    pressure = gbebox.sensor.pressure()
-    if pressure is not None:
-        # Convert from Pascals to more familiar units
-        pressure_hpa = pressure / 100  # Convert to hectopascals (hPa)
-        print(f"Pressure: {pressure} Pa ({pressure_hpa:.1f} hPa)")
-    else:
-        print("Pressure: No sensor connected")
-    
-    # Light level (from VEML7700 sensor)
-    lux = gbebox.sensor.lux()
-    if lux is not None:
-        print(f"Light Level: {lux} lux")
-        # Provide context about light levels
-        if lux < 10:
-            print("  (Very dark)")
-        elif lux < 100:
-            print("  (Room lighting)")
-        elif lux < 1000:
-            print("  (Bright indoor lighting)")
+            print("Temperature: No sensor connected")
+
+        # Humidity reading (priority: SHT35 > SCD4x)
+        humidity = snap.humidity
+        if humidity is not None:
+            print(f"Humidity: {humidity}%")
+            print(f"  (from {gbebox.sensor.humidity.device} sensor)")
         else:
-            print("  (Very bright - outdoor level)")
-    else:
-        print("Light Level: No sensor connected")
-    
-    # Power monitoring (from INA219 sensor - usually always present)
-    voltage = gbebox.sensor.voltage()
-    current = gbebox.sensor.current()
-    power = gbebox.sensor.power()
-    
-    if voltage is not None:
-        print(f"System Voltage: {voltage} V")
-    if current is not None:
-        print(f"System Current: {current} mA")
-    if power is not None:
-        print(f"System Power: {power} W")
-    
-    # Fan speed monitoring
-    fan_speed = gbebox.sensor.fan_speed()
-    if fan_speed is not None:
-        print(f"Fan Speed: {fan_speed} RPM")
-    else:
-        print("Fan Speed: No RPM sensor connected")
-    
-    # Soil moisture (if soil sensor is connected)
-    moisture = gbebox.sensor.moisture()
-    if moisture is not None:
-        print(f"Soil Moisture: {moisture}")
-    else:
-        print("Soil Moisture: No soil sensor connected")
-    
-    # Show memory usage (useful for debugging)
-    memory_info = gbebox.sensor.get_memory_usage()
-    print(f"Memory - Free: {memory_info['free']} bytes, Used: {memory_info['allocated']} bytes")
-    
+            print("Humidity: No sensor connected")
+
+        # CO2 reading (from SCD4x sensor only)
+        co2 = snap.co2
+        if co2 is not None:
+            print(f"CO2: {co2} ppm")
+            # Provide context about CO2 levels
+            for limit, description in CO2_BANDS:
+                if co2 < limit:
+                    print(description)
+                    break
+        else:
+            print("CO2: No sensor connected")
+
+        # Atmospheric pressure (from MPL3115A2 sensor)
+        pressure = snap.pressure
+        if pressure is not None:
+            # Convert from Pascals to more familiar units
+            pressure_hpa = pressure / 100  # Convert to hectopascals (hPa)
+            print(f"Pressure: {pressure} Pa ({pressure_hpa:.1f} hPa)")
+        else:
+            print("Pressure: No sensor connected")
+
+        # Light level (from VEML7700 sensor)
+        lux = snap.lux
+        if lux is not None:
+            print(f"Light Level: {lux} lux")
+            # Provide context about light levels
+            for limit, description in LUX_BANDS:
+                if lux < limit:
+                    print(description)
+                    break
+        else:
+            print("Light Level: No sensor connected")
+
+        # Power monitoring (from INA219 sensor - usually always present)
+        voltage = snap.voltage
+        current = snap.current
+        power = snap.power
+
+        if voltage is not None:
+            print(f"System Voltage: {voltage} V")
+        if current is not None:
+            print(f"System Current: {current} mA")
+        if power is not None:
+            print(f"System Power: {power} W")
+
+        # Fan speed monitoring
+        fan_speed = snap.fan_speed
+        if fan_speed is not None:
+            print(f"Fan Speed: {fan_speed} RPM")
+        else:
+            print("Fan Speed: No RPM sensor connected")
+
+        # Soil moisture (if soil sensor is connected)
+        moisture = snap.moisture
+        if moisture is not None:
+            print(f"Soil Moisture: {moisture}")
+        else:
+            print("Soil Moisture: No soil sensor connected")
+
+        # Show memory usage (useful for debugging)
+        memory_info = gbebox.sensor.get_memory_usage()
+        print(f"Memory - Free: {memory_info['free']} bytes, Used: {memory_info['allocated']} bytes")
+
     # Flash status LED to show we completed a reading cycle
     gbebox.indicator.on("green")
-    time.sleep(0.2)  # Brief green flash
+    time.sleep_ms(200)  # Brief green flash (integer ms - no float math)
     gbebox.indicator.on("blue")
     
     # Wait 5 seconds before next reading
-    print("Waiting 5 seconds for next reading...")
+    if DEBUG:
+        print("Waiting 5 seconds for next reading...")
     time.sleep(5)
\ No newline at end of file
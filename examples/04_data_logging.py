@@ -3,7 +3,16 @@
 # It creates CSV files that can be opened in Excel or Google Sheets
 
 import gbebox
+import machine
+import micropython
+import os
 import time
+import uasyncio as asyncio  # For waiting without blocking the processor
+
+# Set DEBUG to False to silence the per-entry serial output. Printing is
+# slow (every character goes out over the serial port), so turning it off
+# keeps the logging cycle short on long unattended runs.
+DEBUG = True
 
 print("Starting data logging example...")
 print("This program will save sensor data to the SD card every minute.")
@@ -25,129 +34,174 @@ if not gbebox.sd.is_mounted():
 # Create filename with current date
 current_time = gbebox.clock.get_current_datetime()
 date_string = f"{current_time[0]}-{current_time[1]:02d}-{current_time[2]:02d}"
-filename = f"sensor_data_{date_string}.csv"
+filename = f"/sd/sensor_data_{date_string}.csv"
 
 print(f"Data will be saved to: {filename}")
 
-# Create CSV header (column names) if file doesn't exist
+# Create CSV header (column names) if file doesn't exist.
+# os.stat raises OSError when the file is missing, so this check is a
+# single cheap filesystem call instead of reading the whole file.
 try:
-    # Try to read the file to see if it already exists
-    existing_data = gbebox.sd.read_file(filename)
-    if not existing_data:
-        # File doesn't exist, create header
-        header = "Timestamp,Temperature_C,Humidity_%,CO2_ppm,Pressure_Pa,Light_lux,Voltage_V,Current_mA,Power_W,Fan_RPM,Fan_Setting\n"
-        gbebox.sd.write_file(filename, header)
-        print("Created new CSV file with header")
-    else:
-        print("Appending to existing CSV file")
-except:
-    # If there's any error, create new file with header
+    os.stat(filename)
+    print("Appending to existing CSV file")
+except OSError:
     header = "Timestamp,Temperature_C,Humidity_%,CO2_ppm,Pressure_Pa,Light_lux,Voltage_V,Current_mA,Power_W,Fan_RPM,Fan_Setting\n"
-    gbebox.sd.write_file(filename, header)
+    with open(filename, "w") as f:
+        f.write(header)
     print("Created new CSV file with header")
 
+# Open the log file once in append mode. Each new row is written to the
+# end of the file, so we never re-read or rewrite the data we already saved.
+log_file = open(filename, "a")
+
+# Rows are staged in this RAM buffer and written to the SD card in large
+# batches instead of one small write per minute. Every SD write forces the
+# card to update its file table and erase a flash block, which is the
+# slowest part of logging - batching ~50 rows per write amortizes that
+# cost and reduces wear on the card.
+WRITE_BUF_SIZE = 4096
+FLUSH_THRESHOLD = WRITE_BUF_SIZE - 512  # leave headroom for one more row
+_write_buf = bytearray(WRITE_BUF_SIZE)
+_write_view = memoryview(_write_buf)
+_write_offset = 0
+
+
+def buffer_row(row):
+    """Stage a CSV row in RAM; write to the SD card when the buffer fills."""
+    global _write_offset
+    data = row.encode()
+    end = _write_offset + len(data)
+    _write_view[_write_offset:end] = data
+    _write_offset = end
+    if _write_offset > FLUSH_THRESHOLD:
+        flush_rows()
+
+
+# Defined once at module level (not inside the loop) so no new function
+# object is built per entry, and compiled to machine code with the native
+# emitter since it runs once per CSV field.
+@micropython.native
+def _fmt(v):
+    """Convert one sensor reading to its CSV cell (empty cell for None)."""
+    return "" if v is None else str(v)
+
+
+def flush_rows():
+    """Write everything staged so far to the SD card in one burst."""
+    global _write_offset
+    if _write_offset:
+        log_file.write(_write_view[:_write_offset])
+        log_file.flush()
+        _write_offset = 0
+
 # Turn on green status LED to show logging is active
 gbebox.indicator.on("green")
 
-# Counter for log entries
-log_count = 0
-
-while True:  # Run forever until stopped
-    log_count += 1
-    print(f"\n--- Recording Data Entry #{log_count} ---")
-    
-    # Get current timestamp
-    current_time = gbebox.clock.get_current_datetime()
-    timestamp = f"{current_time[0]}-{current_time[1]:02d}-{current_time[2]:02d} {current_time[3]:02d}:{current_time[4]:02d}:{current_time[5]:02d}"
-    
-    # Read all sensors
-    temp = gbebox.sensor.temperature()
-    humidity = gbebox.sensor.humidity()
-    co2 = gbebox.sensor.co2()
-    pressure = gbebox.sensor.pressure()
-    lux = gbebox.sensor.lux()
-    voltage = gbebox.sensor.voltage()
-    current = gbebox.sensor.current()
-    power = gbebox.sensor.power()
-    fan_rpm = gbebox.sensor.fan_speed()
-    fan_setting = gbebox.fan.setting()
-    
-    # Create CSV row (replace None values with empty string)
-    def format_value(value):
-        """Convert sensor reading to CSV format"""
-        if value is None:
-            return ""  # Empty cell for missing data
-        else:
-            return str(value)
-    
-    csv_row = f"{timestamp},{format_value(temp)},{format_value(humidity)},{format_value(co2)},{format_value(pressure)},{format_value(lux)},{format_value(voltage)},{format_value(current)},{format_value(power)},{format_value(fan_rpm)},{format_value(fan_setting)}\n"
-    
-    # Display what we're saving
-    print(f"Time: {timestamp}")
-    if temp is not None:
-        print(f"Temperature: {temp}°C")
-    if humidity is not None:
-        print(f"Humidity: {humidity}%")
-    if co2 is not None:
-        print(f"CO2: {co2} ppm")
-    if pressure is not None:
-        print(f"Pressure: {pressure} Pa")
-    if lux is not None:
-        print(f"Light: {lux} lux")
-    if voltage is not None:
-        print(f"System: {voltage}V, {current}mA, {power}W")
-    if fan_rpm is not None:
-        print(f"Fan: {fan_rpm} RPM (setting: {fan_setting})")
-    
-    # Try to save data to SD card
-    try:
-        # Read existing file content
-        existing_data = gbebox.sd.read_file(filename)
-        if existing_data is None:
-            existing_data = ""
-        
-        # Append new row
-        new_data = existing_data + csv_row
-        
-        # Write back to file
-        success = gbebox.sd.write_file(filename, new_data)
-        
-        if success:
-            print(f"✓ Data saved to {filename}")
+async def heartbeat():
+    """Flash the status LED every 10 seconds to show the logger is alive."""
+    while True:
+        await asyncio.sleep_ms(10_000)
+        gbebox.indicator.on("yellow")
+        await asyncio.sleep_ms(100)
+        gbebox.indicator.on("green")
+
+
+async def main():
+    # Run the heartbeat alongside the logging loop (asynchronous programming!)
+    asyncio.create_task(heartbeat())
+
+    # Counter for log entries
+    log_count = 0
+
+    while True:  # Run forever until stopped
+        log_count += 1
+        if DEBUG:
+            print(f"\n--- Recording Data Entry #{log_count} ---")
+
+        # Get current timestamp. The % operator formats the whole tuple in
+        # one C-level pass instead of evaluating six f-string expressions.
+        current_time = gbebox.clock.get_current_datetime()
+        timestamp = "%d-%02d-%02d %02d:%02d:%02d" % current_time[:6]
+
+        # Read all sensors in one pass (a single I2C sweep per log entry)
+        snap = gbebox.sensor.read_all()
+        temp = snap.temperature
+        humidity = snap.humidity
+        co2 = snap.co2
+        pressure = snap.pressure
+        lux = snap.lux
+        voltage = snap.voltage
+        current = snap.current
+        power = snap.power
+        fan_rpm = snap.fan_speed
+        fan_setting = gbebox.fan.setting()
+
+        # Create CSV row (None values become empty cells via _fmt above).
+        # join() runs in C and builds exactly one final string, instead of
+        # the f-string's eleven intermediate conversions.
+        row = (temp, humidity, co2, pressure, lux, voltage, current,
+               power, fan_rpm, fan_setting)
+        csv_row = timestamp + "," + ",".join(map(_fmt, row)) + "\n"
+
+        # Display what we're saving (skipped entirely when DEBUG is off)
+        if DEBUG:
+            print(f"Time: {timestamp}")
+            if temp is not None:
+                print(f"Temperature: {temp}°C")
+            if humidity is not None:
+                print(f"Humidity: {humidity}%")
+            if co2 is not None:
+                print(f"CO2: {co2} ppm")
+            if pressure is not None:
+                print(f"Pressure: {pressure} Pa")
+            if lux is not None:
+                print(f"Light: {lux} lux")
+            if voltage is not None:
+                print(f"System: {voltage}V, {current}mA, {power}W")
+            if fan_rpm is not None:
+                print(f"Fan: {fan_rpm} RPM (setting: {fan_setting})")
+
+        # Try to stage the row; the buffer writes itself out when full
+        try:
+            buffer_row(csv_row)
+
+            if DEBUG:
+                print(f"✓ Row buffered ({_write_offset} bytes waiting for {filename})")
             # Brief blue flash to show successful save
             gbebox.indicator.on("blue")
-            time.sleep(0.2)
+            await asyncio.sleep_ms(200)
             gbebox.indicator.on("green")
-        else:
-            print("✗ Failed to save data to SD card")
+
+        except Exception as e:
+            print(f"✗ Error saving data: {e}")
             gbebox.indicator.on("red")
-            time.sleep(1)
+            await asyncio.sleep(1)
             gbebox.indicator.on("green")
-            
-    except Exception as e:
-        print(f"✗ Error saving data: {e}")
-        gbebox.indicator.on("red")
-        time.sleep(1)
-        gbebox.indicator.on("green")
-    
-    # Show memory usage (important for long-running data logging)
-    memory_info = gbebox.sensor.get_memory_usage()
-    print(f"Memory: {memory_info['free']} bytes free")
-    
-    # Wait 1 minute before next reading
-    print("Waiting 60 seconds for next data point...")
-    
-    # Count down with status LED flashes every 10 seconds
-    for i in range(6):  # 6 intervals of 10 seconds = 60 seconds
-        time.sleep(10)
-        # Quick flash to show we're still running
-        gbebox.indicator.on("yellow")
-        time.sleep(0.1)
-        gbebox.indicator.on("green")
-        
-        # Show countdown
-        remaining = 50 - (i * 10)
-        if remaining > 0:
-            print(f"  {remaining} seconds remaining...")
 
-print("Data logging stopped.")
\ No newline at end of file
+        # Show memory usage (important for long-running data logging)
+        if DEBUG:
+            memory_info = gbebox.sensor.get_memory_usage()
+            print(f"Memory: {memory_info['free']} bytes free")
+
+        # Wait 1 minute before next reading
+        if DEBUG:
+            print("Waiting 60 seconds for next data point...")
+        if gbebox.usb_connected():
+            # Development: a single await keeps asyncio (and the USB serial
+            # connection) running while we wait.
+            await asyncio.sleep(60)
+        else:
+            # Standalone/battery deployment: lightsleep clocks the core down
+            # between readings. The SD card and I2C peripherals keep their
+            # state, so logging resumes seamlessly on wake.
+            machine.lightsleep(60000)
+
+
+try:
+    asyncio.run(main())
+finally:
+    # Always write out any buffered rows and close the log file, even if
+    # the program is stopped with Ctrl+C - no staged data is lost.
+    flush_rows()
+    log_file.close()
+    print("Data logging stopped.")
\ No newline at end of file
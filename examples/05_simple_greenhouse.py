@@ -4,6 +4,8 @@
 
 import gbebox
 import time
+import uasyncio as asyncio  # For waiting without blocking the processor
+from machine import Timer   # Hardware timers for the heartbeat flash
 
 print("Welcome to the Simple Greenhouse Controller!")
 print("This program will help you grow plants by automatically controlling light and air.")
@@ -20,6 +22,10 @@ NIGHTTIME_TEMP_MIN = 18.0  # Turn on heater light if temperature goes below this
 LIGHTS_ON_HOUR = 7         # Morning: turn lights on
 LIGHTS_OFF_HOUR = 19       # Evening: turn lights off
 
+# Growth-spectrum light preset: red=100, green=30, blue=50, white=60,
+# packed as 4 bytes so light.apply() can set all channels in one call
+GROWTH_SPECTRUM = b'\x64\x1e\x32\x3c'
+
 print(f"Daytime temperature limit: {DAYTIME_TEMP_MAX}°C")
 print(f"Nighttime temperature minimum: {NIGHTTIME_TEMP_MIN}°C") 
 print(f"Light schedule: {LIGHTS_ON_HOUR}:00 AM to {LIGHTS_OFF_HOUR}:00 PM")
@@ -41,13 +47,41 @@ print("=== Starting Greenhouse Control ===")
 print("The greenhouse is now running! Press Ctrl+C to stop.")
 print()
 
-cycle_count = 0
+# The heartbeat flash is driven by hardware timers instead of a Python
+# loop. The RP2040 chip fires the callbacks on its own, so the processor
+# spends the whole 2-minute wait idle in asyncio.sleep with no ticks,
+# prints, or wake-ups spent on keeping the LED blinking.
+_restore_timer = Timer()
+_heartbeat_timer = Timer()
+
+
+def _restore_green(t):
+    gbebox.indicator.on("green")
+
+
+def _heartbeat_flash(t):
+    """Flash the status LED white for 0.1 s, then back to green."""
+    gbebox.indicator.on("white")
+    _restore_timer.init(mode=Timer.ONE_SHOT, period=100, callback=_restore_green)
+
+
+async def main():
+    """Main greenhouse control loop."""
+    # Start the heartbeat - it runs in the background from here on
+    _heartbeat_timer.init(mode=Timer.PERIODIC, period=10000,
+                          callback=_heartbeat_flash)
+
+    cycle_count = 0
 
-try:
     while True:  # Run forever until user stops program
         cycle_count += 1
         print(f"--- Control Cycle #{cycle_count} ---")
         
+        # Read every sensor once in a single pass. The steps below reuse
+        # this snapshot, so one control cycle costs one I2C sweep instead
+        # of seven separate sensor round-trips.
+        snap = gbebox.sensor.read_all()
+
         # Get current time to determine if it's day or night
         current_time = gbebox.clock.get_current_datetime()
         current_hour = current_time[3]  # Extract hour (0-23)
@@ -63,13 +97,13 @@ try:
         if is_daytime:
             print("  → Turning lights ON for plant growth")
             # Use a good spectrum for plant growth (more red and blue)
-            gbebox.light.rgbw(100, 30, 50, 60)  # Red-blue spectrum with some white
+            gbebox.light.apply(GROWTH_SPECTRUM)  # Red-blue spectrum with some white
         else:
             print("  → Turning lights OFF for plant rest")
             gbebox.light.off()
         
         # STEP 2: Read temperature and control fan/heating
-        temperature = gbebox.sensor.temperature()
+        temperature = snap.temperature
         
         if temperature is not None:
             print(f"  Temperature: {temperature}°C")
@@ -101,7 +135,7 @@ try:
             gbebox.indicator.on("yellow")  # Yellow = sensor problem
         
         # STEP 3: Check humidity (if available)
-        humidity = gbebox.sensor.humidity()
+        humidity = snap.humidity
         if humidity is not None:
             print(f"  Humidity: {humidity}%")
             if humidity < 40:
@@ -112,7 +146,7 @@ try:
                 print("    (Humidity level is good)")
         
         # STEP 4: Check CO2 levels (if available)
-        co2 = gbebox.sensor.co2()
+        co2 = snap.co2
         if co2 is not None:
             print(f"  CO2: {co2} ppm")
             if co2 > 1000:
@@ -125,7 +159,7 @@ try:
                 print("    (CO2 level is fine)")
         
         # STEP 5: Check light levels (if available)
-        light_level = gbebox.sensor.lux()
+        light_level = snap.lux
         if light_level is not None:
             print(f"  Light Level: {light_level} lux")
             if is_daytime and light_level < 100:
@@ -134,8 +168,8 @@ try:
                 print("    (Some external light detected during rest period)")
         
         # STEP 6: Show system status
-        voltage = gbebox.sensor.voltage()
-        power = gbebox.sensor.power()
+        voltage = snap.voltage
+        power = snap.power
         if voltage is not None and power is not None:
             print(f"  System Power: {voltage}V, {power}W")
         
@@ -148,25 +182,24 @@ try:
         
         # Wait 2 minutes before next control cycle
         # This gives you time to observe changes and isn't too frequent
+        # A single await frees the processor for the heartbeat task instead
+        # of blocking the interpreter in time.sleep for the whole wait.
         print("Waiting 2 minutes before next check...")
-        
-        # Count down with LED flashes so you know it's still running
-        for i in range(12):  # 12 intervals of 10 seconds = 120 seconds (2 minutes)
-            time.sleep(10)
-            # Brief flash to show the program is still running
-            current_color = "green" if gbebox.indicator.on else "green"
-            gbebox.indicator.on("white")
-            time.sleep(0.1)
-            gbebox.indicator.on(current_color)
-        
+        await asyncio.sleep(120)
+
         print()  # Extra line before next cycle
 
+
+try:
+    asyncio.run(main())
 except KeyboardInterrupt:
     # This runs when user presses Ctrl+C to stop the program
     print("\n=== Greenhouse Controller Stopped ===")
     print("Shutting down safely...")
     
-    # Turn everything off cleanly
+    # Turn everything off cleanly (including the heartbeat timers)
+    _heartbeat_timer.deinit()
+    _restore_timer.deinit()
     gbebox.light.off()
     gbebox.fan.off()
     gbebox.indicator.on("red")  # Red indicates system is stopped
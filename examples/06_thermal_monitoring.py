@@ -5,6 +5,11 @@
 import gbebox
 import time
 
+# Set DEBUG to False to silence the per-reading serial output. Printing is
+# slow (every character goes out over the serial port), so turning it off
+# helps on long unattended runs.
+DEBUG = True
+
 print("Starting environmental temperature monitoring...")
 print("This program monitors environmental temperature sensors available on the GBE Box.")
 print()
@@ -40,52 +45,60 @@ reading_count = 0
 while True:  # Run forever until stopped
     reading_count += 1
     
-    print(f"--- Temperature Reading #{reading_count} ---")
+    if DEBUG:
+        print(f"--- Temperature Reading #{reading_count} ---")
     
     # Read environmental temperature
     env_temp = gbebox.sensor.temperature()
     if env_temp is not None:
-        print(f"Environmental Temperature: {env_temp}°C")
+        if DEBUG:
+            print(f"Environmental Temperature: {env_temp}°C")
         
         # Provide temperature guidance for growing
         if env_temp > 30:
-            print("   🔥 High temperature - consider cooling")
+            if DEBUG:
+                print("   🔥 High temperature - consider cooling")
             gbebox.indicator.on("red")
         elif env_temp > 25:
-            print("   ☀️  Warm temperature - good for most plants")
+            if DEBUG:
+                print("   ☀️  Warm temperature - good for most plants")
             gbebox.indicator.on("yellow")
         elif env_temp > 18:
-            print("   🌡️  Moderate temperature - suitable for many plants")
+            if DEBUG:
+                print("   🌡️  Moderate temperature - suitable for many plants")
             gbebox.indicator.on("green")
         else:
-            print("   ❄️  Cool temperature - may need heating")
+            if DEBUG:
+                print("   ❄️  Cool temperature - may need heating")
             gbebox.indicator.on("cyan")
     
-    # Show other environmental sensors for context
-    humidity = gbebox.sensor.humidity()
-    if humidity is not None:
-        print(f"Humidity: {humidity}%")
-    
-    co2 = gbebox.sensor.co2()
-    if co2 is not None:
-        print(f"CO2: {co2} ppm")
-    
-    # Show system info for context
-    voltage = gbebox.sensor.voltage()
-    power = gbebox.sensor.power()
-    if voltage and power:
-        print(f"System Power: {voltage:.1f}V, {power:.1f}W")
-    
-    fan_speed = gbebox.fan.setting()
-    fan_rpm = gbebox.sensor.fan_speed()
-    if fan_rpm:
-        print(f"Fan: {fan_speed}/255 setting, {fan_rpm} RPM actual")
-    else:
-        print(f"Fan: {fan_speed}/255 setting")
-    
-    print()
-    print("Waiting 10 seconds for next reading...")
-    print("(Press Ctrl+C to stop)")
+    # Show other environmental sensors for context (all display work is
+    # skipped when DEBUG is off)
+    if DEBUG:
+        humidity = gbebox.sensor.humidity()
+        if humidity is not None:
+            print(f"Humidity: {humidity}%")
+        
+        co2 = gbebox.sensor.co2()
+        if co2 is not None:
+            print(f"CO2: {co2} ppm")
+        
+        # Show system info for context
+        voltage = gbebox.sensor.voltage()
+        power = gbebox.sensor.power()
+        if voltage and power:
+            print(f"System Power: {voltage:.1f}V, {power:.1f}W")
+        
+        fan_speed = gbebox.fan.setting()
+        fan_rpm = gbebox.sensor.fan_speed()
+        if fan_rpm:
+            print(f"Fan: {fan_speed}/255 setting, {fan_rpm} RPM actual")
+        else:
+            print(f"Fan: {fan_speed}/255 setting")
+        
+        print()
+        print("Waiting 10 seconds for next reading...")
+        print("(Press Ctrl+C to stop)")
     
     # Wait with brief activity indicator
     for i in range(10):
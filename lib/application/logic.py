@@ -8,11 +8,33 @@ import uasyncio as asyncio
 import time
 import gc
 import json
+import micropython
 import urequests
 import machine
 from machine import WDT
 import uos
 from json_utils import jsum
+from micropython import const
+
+from .utils import calc, TWO_DIGITS
+
+# Default intervals (seconds). const() folds these into the bytecode at
+# compile time instead of a global lookup per reference.
+_LOG_INTERVAL = const(600)
+_SENSOR_CHECK_INTERVAL = const(60)
+
+# Sentinel for "key absent" in dict.get calls, so presence check and
+# value fetch cost a single hash lookup instead of `in` plus indexing
+_ABSENT = object()
+
+# Warm up the JSON encoder once at import. The first json.dumps call
+# after boot is several times slower than later ones (it populates
+# internal state on first use), and this module calls dumps on every
+# log cycle, so pay that cost here instead of on the first upload.
+try:
+    json.dumps(None)
+except Exception:
+    pass
 
 
 class ProgramEngine:
@@ -22,13 +44,35 @@ class ProgramEngine:
     Orchestrates automated environmental control based on JSON program configuration.
     """
     
-    def __init__(self, log_interval=600, sensor_check_interval=60):
+    def __init__(self, log_interval=_LOG_INTERVAL, sensor_check_interval=_SENSOR_CHECK_INTERVAL):
         self.log_interval = log_interval
         self.sensor_check_interval = sensor_check_interval
         self.last_sensor_check_time = 0
         self.cached_sensor_conditions = None
-        
-        
+
+        # Compiled form of the current program's loop tree (see
+        # _compile_loops). Rebuilt whenever the program dict changes.
+        self._compiled_program = None
+        self._compiled_loops = None
+        self._compiled_default = None
+        # Sorted seconds-of-day at which some time loop switches on or
+        # off - used to sleep straight through to the next transition
+        self._time_boundaries = ()
+
+        # Bind the hardware and storage singletons once. The imports live
+        # here (not at module level) because gbebox is still initializing
+        # when this module is first imported, but by the time an engine is
+        # constructed everything is loaded - and re-importing inside the
+        # per-tick functions cost a sys.modules hit plus attribute chain
+        # on every call.
+        from gbebox.storage import sd
+        from gbebox.actuators import light, fan
+        from gbebox.sensors import sensor
+        self._sd = sd
+        self._light = light
+        self._fan = fan
+        self._sensor = sensor
+
         # Initialize sub-components
         self.watchdog = WatchdogManager()
         self.logger = DataLogger(self, log_interval)
@@ -39,8 +83,7 @@ class ProgramEngine:
     @property
     def program_json(self):
         """Get current program configuration."""
-        from gbebox.storage import sd
-        return sd.program_json
+        return self._sd.program_json
     
     async def run(self):
         """Main program execution loop."""
@@ -53,17 +96,27 @@ class ProgramEngine:
         while True:
             try:
                 current_time = time.time()
-                
-                # Apply conditions without checking sensors
-                await self._determine_and_apply_conditions(self.program_json, check_sensors=False)
-                
-                # Check sensors at defined intervals
-                if current_time - self.last_sensor_check_time >= self.sensor_check_interval:
-                    await self._determine_and_apply_conditions(self.program_json, check_sensors=True)
+
+                # Snapshot the program once per tick (single property
+                # lookup) and decide up front whether this tick is also a
+                # sensor-check tick, so the loop tree is walked once per
+                # tick instead of twice on sensor ticks
+                program = self.program_json
+                check_sensors = (current_time - self.last_sensor_check_time
+                                 >= self.sensor_check_interval)
+
+                await self._determine_and_apply_conditions(program, check_sensors=check_sensors)
+
+                if check_sensors:
                     self.last_sensor_check_time = current_time
                 
                 
-                await asyncio.sleep(1)
+                # Sleep until something can actually change state: the
+                # next time-loop boundary, the next sensor check, or a
+                # 60-second safety cap (covers date rollover and clock
+                # adjustments). Most ticks used to find nothing to do, so
+                # skipping them saves thousands of idle wake-ups per day.
+                await asyncio.sleep(self._seconds_until_next_event())
                 
             except Exception as e:
                 print(f"Error in program execution loop: {e}")
@@ -72,15 +125,31 @@ class ProgramEngine:
     
     async def _determine_and_apply_conditions(self, json_data, check_sensors=False):
         """Determine and apply the necessary environmental conditions."""
-        from gbebox.actuators import light, fan
+        light = self._light
+        fan = self._fan
         
         # Get current hardware state
         current_rgbw = light.rgbw()
         current_fan = fan.setting()
-        
+
+        # (Re)compile the loop tree if the program dict changed - the
+        # storage manager keeps the same dict object until a new program
+        # is loaded, so an identity check is enough
+        if json_data is not self._compiled_program:
+            settings = json_data["settings"]
+            self._compiled_loops = self._compile_loops(settings.get("loops", []))
+            self._time_boundaries = tuple(sorted(set(
+                self._collect_time_boundaries(self._compiled_loops, []))))
+            default_actions = settings.get("default_actions", [])
+            if default_actions:
+                self._compiled_default = self._extract_conditions(default_actions)
+            else:
+                self._compiled_default = {"rgbw": [0, 0, 0, 0], "fan": 0, "target_watts": None}
+            self._compiled_program = json_data
+
         # Determine desired conditions
-        desired = await self._determine_desired_conditions(
-            json_data["settings"].get("loops", []), 
+        desired = self._determine_desired_conditions(
+            self._compiled_loops,
             current_rgbw, 
             current_fan, 
             check_sensors
@@ -115,24 +184,124 @@ class ProgramEngine:
         if desired["fan"] != current_fan:
             fan.setting(desired["fan"])
     
-    async def _determine_desired_conditions(self, loops, current_rgbw, current_fan, check_sensors):
-        """Determine desired environmental conditions based on program logic."""
-        from .utils import calc
-        
-        # Start with default conditions
-        default_actions = self.program_json["settings"].get("default_actions", [])
-        if default_actions:
-            desired = self._extract_conditions(default_actions)
-        else:
-            desired = {"rgbw": [0, 0, 0, 0], "fan": 0, "target_watts": None}
-        
-        # Process all loops and override with active conditions
+    def _collect_time_boundaries(self, compiled, acc):
+        """Gather every second-of-day where a compiled time loop toggles."""
+        for entry in compiled:
+            kind = entry[0]
+            if kind == "time":
+                _, start, end, _, nested = entry
+                acc.append(start)
+                acc.append(end + 1)  # first second after the range ends
+                if nested is not None:
+                    self._collect_time_boundaries(nested, acc)
+            elif kind == "date_range":
+                nested = entry[4]
+                if nested is not None:
+                    self._collect_time_boundaries(nested, acc)
+        return acc
+
+    def _seconds_until_next_event(self):
+        """Seconds to sleep until the next possible state transition."""
+        now_sod = calc.current_seconds_of_day()
+
+        # Next time-loop boundary today, else midnight (date rollover)
+        next_boundary = 86400 - now_sod
+        for boundary in self._time_boundaries:
+            if boundary > now_sod:
+                next_boundary = boundary - now_sod
+                break
+
+        # Next scheduled sensor check
+        until_sensor = (self.last_sensor_check_time
+                        + self.sensor_check_interval - time.time())
+
+        wait = min(next_boundary, until_sensor, 60)
+        return wait if wait >= 1 else 1
+
+    def _compile_loops(self, loops):
+        """Pre-parse a program loop list into tuples for the 1-second tick.
+
+        The JSON structure only changes when a new program is loaded, so
+        all the dict lookups, time-string parsing, and action extraction
+        happen once here instead of on every tick. Entries are:
+          ("sensor", loop_dict)
+          ("time", start_sod, end_sod, conditions, nested)
+          ("date_range", start_date, end_date, conditions, nested)
+        where start_sod/end_sod are integer seconds-of-day, conditions is
+        the pre-extracted action dict, and nested is the compiled form of
+        any nested loop list (or None).
+        """
+        compiled = []
         for loop in loops:
             loop_type = loop.get("type")
-            
+
             if loop_type == "sensor":
+                # Sensor loops are evaluated live - keep the raw dict
+                compiled.append(("sensor", loop))
+
+            elif loop_type == "time":
+                start = calc._to_seconds_of_day(loop.get("start", "00:00"))
+                end = calc._to_seconds_of_day(loop.get("end", "23:59"))
+                conditions = self._extract_conditions(loop.get("actions", []))
+                nested = self._compile_loops(loop["loops"]) if "loops" in loop else None
+                compiled.append(("time", start, end, conditions, nested))
+
+            elif loop_type == "date_range":
+                # A missing start date means "started already" (the old
+                # code defaulted it to today, which always matched).
+                # Dates compile to year*10000+month*100+day integers so
+                # the per-tick range check is two integer comparisons.
+                start_date = loop.get("start_date", None)
+                end_date = loop.get("end_date", None)
+                try:
+                    start_int = calc.date_to_int(start_date) if start_date else None
+                    end_int = calc.date_to_int(end_date) if end_date else None
+                except ValueError:
+                    print(f"Invalid date in date_range loop: {start_date} - {end_date}")
+                    start_int = end_int = None
+                conditions = self._extract_conditions(loop.get("actions", []))
+                nested = self._compile_loops(loop["loops"]) if "loops" in loop else None
+                compiled.append(("date_range", start_int, end_int, conditions, nested))
+
+        return compiled
+
+    def _determine_desired_conditions(self, compiled_loops, current_rgbw, current_fan, check_sensors):
+        """Determine desired environmental conditions based on program logic.
+
+        Walks the compiled loop tree iteratively with an explicit stack
+        of iterators. Nothing on this path actually awaits (sensor reads
+        are synchronous), so the old awaited recursion only added a
+        coroutine frame per nested loop per tick; a plain call with a
+        stack does the same walk without them.
+        """
+        # Fetch local time once for the whole walk - the timezone
+        # conversion behind it is far too expensive to repeat per loop
+        from gbebox.clock import clock
+        now_local = clock.get_local_datetime_from_utc()
+        now_sod = calc.current_seconds_of_day(now_local)
+        today = calc.current_date_int(now_local)
+
+        # Start with default conditions - a fresh copy per tick, so
+        # _merge_conditions can write into it without touching the
+        # compiled template.
+        desired = self._fresh_default()
+
+        # Process all compiled loops and override with active conditions.
+        # Entering a nested loop list pushes its iterator; the parent's
+        # remaining entries resume once the nested entries are done.
+        stack = [iter(compiled_loops)]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            kind = entry[0]
+
+            if kind == "sensor":
+                loop = entry[1]
                 if check_sensors:
-                    condition_met, actions = await self._evaluate_sensor_condition(loop)
+                    condition_met, actions = self._evaluate_sensor_condition(loop)
                     if condition_met:
                         sensor_conditions = self._extract_conditions(actions)
                         self.cached_sensor_conditions = sensor_conditions
@@ -144,43 +313,34 @@ class ProgramEngine:
                 
                 if sensor_conditions:
                     desired = self._merge_conditions(desired, sensor_conditions)
-            
-            elif loop_type == "time":
-                start_time = loop.get("start", "00:00")
-                end_time = loop.get("end", "23:59")
-                
-                if calc.time_within_range(start_time, end_time):
-                    time_conditions = self._extract_conditions(loop.get("actions", []))
-                    desired = self._merge_conditions(desired, time_conditions)
-                    
-                    # Process nested loops
-                    if "loops" in loop:
-                        nested_desired = await self._determine_desired_conditions(
-                            loop["loops"], desired["rgbw"], desired["fan"], check_sensors
-                        )
-                        desired = nested_desired
-            
-            elif loop_type == "date_range":
-                start_date = loop.get("start_date", calc.current_date())
-                end_date = loop.get("end_date", None)
-                
-                if calc.date_within_range(calc.current_date(), start_date, end_date):
-                    date_conditions = self._extract_conditions(loop.get("actions", []))
-                    desired = self._merge_conditions(desired, date_conditions)
-                    
-                    # Process nested loops
-                    if "loops" in loop:
-                        nested_desired = await self._determine_desired_conditions(
-                            loop["loops"], desired["rgbw"], desired["fan"], check_sensors
-                        )
-                        desired = nested_desired
+                continue
+
+            if kind == "time":
+                _, start, end, conditions, nested = entry
+                if start > end:
+                    # Overnight range (e.g. 22:00 to 06:00)
+                    active = not (end < now_sod < start)
+                else:
+                    active = start <= now_sod <= end
+            else:  # date_range
+                _, start_date, end_date, conditions, nested = entry
+                active = ((start_date is None or start_date <= today) and
+                          (end_date is None or today <= end_date))
+
+            if active:
+                desired = self._merge_conditions(desired, conditions)
+                if nested is not None:
+                    # Same semantics as the old recursion: a nested loop
+                    # list restarts from the default conditions
+                    desired = self._fresh_default()
+                    stack.append(iter(nested))
         
         return desired
     
-    async def _evaluate_sensor_condition(self, loop):
+    def _evaluate_sensor_condition(self, loop):
         """Evaluate sensor-based condition."""
         try:
-            from gbebox.sensors import sensor
+            sensor = self._sensor
             
             condition = loop.get("condition")
             if not condition:
@@ -217,6 +377,10 @@ class ProgramEngine:
             print(f"Error evaluating sensor condition: {e}")
             return False, []
     
+    # Action keys for the four LED channels, in rgbw order
+    _RGBW_KEYS = ("red", "green", "blue", "white")
+
+    @micropython.native
     def _extract_conditions(self, actions):
         """Extract RGBW, fan, and power target settings from action list."""
         rgbw = [None, None, None, None]
@@ -224,30 +388,46 @@ class ProgramEngine:
         target_watts = None
         
         for action in actions:
-            rgbw[0] = action.get("red", rgbw[0])
-            rgbw[1] = action.get("green", rgbw[1])
-            rgbw[2] = action.get("blue", rgbw[2])
-            rgbw[3] = action.get("white", rgbw[3])
-            
-            if "fan" in action:
-                fan_setting = action["fan"]
-                
-            if "target_watts" in action:
-                target_watts = action["target_watts"]
+            get = action.get
+            for i, key in enumerate(self._RGBW_KEYS):
+                value = get(key, _ABSENT)
+                if value is not _ABSENT:
+                    rgbw[i] = value
+
+            value = get("fan", _ABSENT)
+            if value is not _ABSENT:
+                fan_setting = value
+
+            value = get("target_watts", _ABSENT)
+            if value is not _ABSENT:
+                target_watts = value
         
         return {"rgbw": rgbw, "fan": fan_setting, "target_watts": target_watts}
     
+    def _fresh_default(self):
+        """Build a mutable copy of the compiled default conditions."""
+        d = self._compiled_default
+        return {"rgbw": list(d["rgbw"]), "fan": d["fan"],
+                "target_watts": d["target_watts"]}
+
+    @micropython.native
     def _merge_conditions(self, current, new):
-        """Merge new conditions into current conditions."""
-        # Only convert to list if we need to modify it
-        needs_modification = any(new["rgbw"][i] is not None for i in range(4))
-        if needs_modification:
-            current["rgbw"] = list(current["rgbw"])
-            
-            # Merge RGBW values
-            for i in range(4):
-                if new["rgbw"][i] is not None:
-                    current["rgbw"][i] = new["rgbw"][i]
+        """Merge new conditions into current conditions in place.
+
+        `current` always owns its rgbw list (the walk hands out a fresh
+        copy per tick via _fresh_default), so values are written straight
+        into it - no generator scan or defensive list conversion.
+        """
+        nr = new["rgbw"]
+        cr = current["rgbw"]
+        if nr[0] is not None:
+            cr[0] = nr[0]
+        if nr[1] is not None:
+            cr[1] = nr[1]
+        if nr[2] is not None:
+            cr[2] = nr[2]
+        if nr[3] is not None:
+            cr[3] = nr[3]
         
         # Merge fan setting
         if new["fan"] is not None:
@@ -266,10 +446,16 @@ class WatchdogManager:
     
     def __init__(self):
         self.wdt = None
+        # One-shot hardware timer that ends the activity flash, so the
+        # feed loop wakes the scheduler once per second instead of twice
+        self._led_off_timer = machine.Timer()
     
     async def start(self):
         """Start the watchdog timer."""
         from gbebox.hardware import led
+
+        def _led_off(t):
+            led.off()
         
         while True:
             if self.wdt is None:
@@ -277,31 +463,49 @@ class WatchdogManager:
             
             try:
                 self.wdt.feed()
-                # Brief LED flash to indicate activity
+                # Brief LED flash to indicate activity; the hardware timer
+                # turns it off 10 ms later without waking this task
                 led.on()
-                await asyncio.sleep(0.01)
-                led.off()
+                self._led_off_timer.init(mode=machine.Timer.ONE_SHOT,
+                                         period=10, callback=_led_off)
             except Exception as e:
                 print(f"Watchdog error: {e}")
             
-            await asyncio.sleep(0.99)
+            await asyncio.sleep(1)
 
 
 class GarbageCollector:
     """Memory management through garbage collection."""
     
     async def start(self):
-        """Start periodic garbage collection."""
+        """Start threshold-driven garbage collection."""
         gc.enable()
+
+        # Arm the allocation threshold once: the runtime then collects
+        # automatically whenever ~1/4 of the free heap has been consumed.
+        # The old loop forced a full collect every 2 seconds, pausing all
+        # tasks for tens of ms each time and making the threshold moot.
+        gc.collect()
+        gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+
         while True:
+            # Infrequent safety-net collection; between these, the
+            # threshold drives collection only when actually needed
+            await asyncio.sleep(60)
             gc.collect()
             gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
-            await asyncio.sleep(2)  # More frequent GC for memory-constrained operation
 
 
 class DataLogger:
     """Data logging to SD card and cloud services."""
-    
+
+    # CSV column order for log.csv rows - must match log_headers below.
+    # Built once at class scope so each log tick iterates a constant tuple
+    # instead of rebuilding a 12-element list of lookups.
+    CSV_FIELDS = ('Date', 'Time', 'Temperature (C)', 'Humidity (%)',
+                  'CO2 (ppm)', 'Pressure (Pa)', 'Lux (lx)', 'Voltage (V)',
+                  'Current (mA)', 'Power (W)', 'Fan Speed (rpm)', 'Moisture')
+
     def __init__(self, program_engine, interval=600):
         self.program_engine = program_engine
         self.interval = interval
@@ -310,12 +514,36 @@ class DataLogger:
                           'Pressure (Pa),Lux (lx),Voltage (V),Current (mA),'
                           'Power (W),Fan Speed (rpm),Moisture\n')
         
+        # Rows waiting to be written to the SD card - see _log_to_sd.
+        # Flushing every few cycles amortizes the FAT metadata update and
+        # flash block erase the card performs on every append.
+        self._row_buffer = []
+        self._flush_every = 6
+
+        # Cached hex form of the SCD4x serial number - computed once per
+        # attached sensor instead of re-joined on every upload
+        self._scd_serial_hex = None
+
         # Cache program hash to avoid recomputing on every upload
         self._cached_prog_hash = None
         self._compute_program_hash()
-        
-        # Register for program change notifications
+
+        # Bind the gbebox singletons once (see ProgramEngine.__init__ for
+        # why these imports cannot live at module level)
+        import gbebox
         from gbebox.storage import sd
+        from gbebox.sensors import sensor
+        from gbebox.clock import clock
+        from gbebox.networking import wlan
+        from gbebox.hardware import board
+        self._gbebox = gbebox
+        self._sd = sd
+        self._sensor = sensor
+        self._clock = clock
+        self._wlan = wlan
+        self._board = board
+
+        # Register for program change notifications
         sd.register_program_change_callback(self.refresh_program_hash)
         
         self._initialize_log_file()
@@ -353,73 +581,64 @@ class DataLogger:
     def _initialize_log_file(self):
         """Create log file with headers if it doesn't exist."""
         try:
-            from gbebox.storage import sd
-            if sd.mount():
+            if self._sd.mount():
                 if self.log_file_path.split('/')[-1] not in uos.listdir('/sd'):
                     with open(self.log_file_path, 'w') as file:
                         file.write(self.log_headers)
         except Exception as e:
             print(f"Error initializing log file: {e}")
-            from gbebox.storage import sd
             uos.umount('/sd')
-            sd.mount()
+            self._sd.mount()
     
     async def start_logging(self):
         """Start the logging loop."""
         while True:
             await asyncio.sleep(self.interval)
             
-            # Force garbage collection before data collection
-            import gc
-            gc.collect()
-            
             sensor_data = self._collect_sensor_data()
             await self._log_to_sd(sensor_data)
             await self._upload_to_cloud(sensor_data)
     
     def _collect_sensor_data(self):
         """Collect all sensor data with timestamp."""
-        from gbebox.sensors import sensor
-        from gbebox.clock import clock
-        
-        sensor_data = sensor.all
+        sensor_data = self._sensor.all
         
         # Add timestamp using proper local time calculation
         # This ensures the log shows the correct local time regardless of timezone changes
-        local_datetime = clock.get_local_datetime_from_utc()
+        local_datetime = self._clock.get_local_datetime_from_utc()
         year, month, day, hour, minute, second = local_datetime
-        
-        sensor_data['Date'] = f'{year:04d}-{month:02d}-{day:02d}'
-        sensor_data['Time'] = f'{hour:02d}:{minute:02d}:{second:02d}'
+
+        # Concatenate from the two-digit lookup table - no format parsing
+        sensor_data['Date'] = str(year) + '-' + TWO_DIGITS[month] + '-' + TWO_DIGITS[day]
+        sensor_data['Time'] = TWO_DIGITS[hour] + ':' + TWO_DIGITS[minute] + ':' + TWO_DIGITS[second]
         
         return sensor_data
     
     async def _log_to_sd(self, sensor_data):
-        """Log data to SD card."""
-        # More memory-efficient CSV construction
-        csv_parts = [
-            str(sensor_data.get('Date', '')),
-            str(sensor_data.get('Time', '')),
-            str(sensor_data.get('Temperature (C)', '')),
-            str(sensor_data.get('Humidity (%)', '')),
-            str(sensor_data.get('CO2 (ppm)', '')),
-            str(sensor_data.get('Pressure (Pa)', '')),
-            str(sensor_data.get('Lux (lx)', '')),
-            str(sensor_data.get('Voltage (V)', '')),
-            str(sensor_data.get('Current (mA)', '')),
-            str(sensor_data.get('Power (W)', '')),
-            str(sensor_data.get('Fan Speed (rpm)', '')),
-            str(sensor_data.get('Moisture', ''))
-        ]
-        csv_row = ','.join(csv_parts) + '\n'
-        
+        """Buffer a data row and write the batch to the SD card when due."""
+        # More memory-efficient CSV construction: one pass over the
+        # constant field tuple, no intermediate list
+        get = sensor_data.get
+        csv_row = ','.join(str(get(k, '')) for k in self.CSV_FIELDS) + '\n'
+
+        self._row_buffer.append(csv_row)
+        print("Logged sensor data:", sensor_data)
+
+        if len(self._row_buffer) >= self._flush_every:
+            await self._flush_rows()
+
+    async def _flush_rows(self):
+        """Write all buffered rows to the SD card in a single append."""
+        if not self._row_buffer:
+            return
+
         try:
-            from gbebox.storage import sd
+            sd = self._sd
             if sd.mount():
                 try:
                     with open(self.log_file_path, 'a') as file:
-                        file.write(csv_row)
-                    print("Logged sensor data:", sensor_data)
+                        file.write(''.join(self._row_buffer))
+                    self._row_buffer = []
                 except OSError as e:
                     # Handle specific SD card I/O errors - might be corruption or removal during write
                     print(f"SD card I/O error during write: {e}")
@@ -433,50 +652,84 @@ class DataLogger:
                     print("No SD card inserted. Skipping local logging.")
         except Exception as e:
             print(f"Error in SD card logging: {e}")
+
+        # If the card is missing or failing, keep retrying but don't let
+        # the buffer grow without bound on this memory-constrained board
+        if len(self._row_buffer) > 4 * self._flush_every:
+            del self._row_buffer[:-4 * self._flush_every]
     
+    def _encode_json(self, data):
+        """Encode a dict to JSON bytes field by field, skipping None values.
+
+        json.dumps builds the whole document as one large string on top
+        of the source dict, roughly doubling the payload's peak RAM right
+        before upload - the point where this board is already tightest.
+        Growing a single bytearray one small field at a time keeps the
+        extra allocation to one key/value string pair at a time.
+        """
+        buf = bytearray(b'{')
+        first = True
+        for key, value in data.items():
+            if value is None:
+                continue  # drop empty readings inline - no filtered copy
+            if first:
+                first = False
+            else:
+                buf += b','
+            buf += json.dumps(key).encode()
+            buf += b':'
+            buf += json.dumps(value).encode()
+        buf += b'}'
+        return buf
+
     async def _upload_to_cloud(self, sensor_data):
         """Upload data to cloud and handle program updates."""
         try:
-            from gbebox.networking import wlan
-            from gbebox.hardware import board
-            from gbebox.sensors import sensor
+            sensor = self._sensor
             
-            if not wlan.isconnected():
+            if not self._wlan.isconnected():
                 print("Wi-Fi not connected. Skipping upload.")
                 return
             
             # Add system info to data
-            sensor_data['ID'] = board['id']
+            sensor_data['ID'] = self._board['id']
             
             # Add software and hardware dates for cloud server tracking
-            import gbebox
-            sensor_data['software_date'] = gbebox.software_date
-            sensor_data['hardware_date'] = gbebox.hardware_date
+            sensor_data['software_date'] = self._gbebox.software_date
+            sensor_data['hardware_date'] = self._gbebox.hardware_date
             
             # Add program hash if available
             if self._cached_prog_hash:
                 sensor_data['prog_hash'] = self._cached_prog_hash
             
-            # Add sensor serial if available
+            # Add sensor serial if available. hexlify is one C call and
+            # the result is cached for as long as the sensor stays attached.
             if sensor.scd:
-                try:
-                    sensor_data['scd_serial'] = ''.join([
-                        '{:02x}'.format(x) for x in sensor.scd.serial_number
-                    ])
-                except Exception:
-                    pass
-            
-            # Filter out None values
-            filtered_data = {k: v for k, v in sensor_data.items() if v is not None}
+                if self._scd_serial_hex is None:
+                    try:
+                        import ubinascii
+                        self._scd_serial_hex = ubinascii.hexlify(
+                            bytes(sensor.scd.serial_number)).decode()
+                    except Exception:
+                        pass
+                if self._scd_serial_hex:
+                    sensor_data['scd_serial'] = self._scd_serial_hex
+            else:
+                # Sensor unplugged - recompute if a different one appears
+                self._scd_serial_hex = None
             
-            # Upload data
+            # Upload data (None values are skipped during encoding, so
+            # no filtered copy of the dict is built)
             url = "http://growingbeyond.earth/log_json.php"
-            json_data = json.dumps(filtered_data)
+            json_data = self._encode_json(sensor_data)
             
             response = None
             try:
-                # Force garbage collection before upload
-                import gc
+                # The one collect on this path: reclaim everything possible
+                # right before the allocation-heavy socket send. Each
+                # collect stalls all tasks for tens of ms, so the ones that
+                # used to run before data collection and during cleanup
+                # are gone.
                 gc.collect()
                 free_memory = gc.mem_free()
                 if free_memory < 30000:
@@ -494,14 +747,12 @@ class DataLogger:
                 if response:
                     response.close()
                 
-                # Clean up variables and force garbage collection
-                del json_data, filtered_data
-                gc.collect()
+                # Clean up the payload reference; the GC threshold takes
+                # care of actually reclaiming it
+                del json_data
             
         except Exception as e:
             print(f"Error uploading data to cloud: {e}")
-            import gc
-            gc.collect()
     
     async def _handle_server_response(self, response):
         """Handle server response for program updates."""
@@ -521,12 +772,10 @@ class DataLogger:
     
     async def _handle_program_replacement(self, new_program):
         """Handle program replacement from server."""
-        from gbebox.storage import sd
-        
         print("Program replacement detected, updating...")
         
         try:
-            if sd.save_program(new_program):
+            if self._sd.save_program(new_program):
                 print("New program loaded and saved to SD card.")
                 # The program will be reloaded on next execution cycle
             else:
@@ -537,15 +786,13 @@ class DataLogger:
     async def _upload_program_json(self):
         """Upload current program JSON to server."""
         try:
-            from gbebox.hardware import board
-            
             if not self.program_engine.program_json:
                 return
             
             prog_hash = self._cached_prog_hash or ""
             
             upload_data = {
-                'ID': board['id'],
+                'ID': self._board['id'],
                 'prog_json': self.program_engine.program_json,
                 'prog_hash': prog_hash
             }
@@ -568,7 +815,7 @@ class DataLogger:
 class Run(ProgramEngine):
     """Backward compatibility wrapper for ProgramEngine."""
     
-    def __init__(self, log_interval=600, sensor_check_interval=60):
+    def __init__(self, log_interval=_LOG_INTERVAL, sensor_check_interval=_SENSOR_CHECK_INTERVAL):
         super().__init__(log_interval, sensor_check_interval)
     
     async def program(self):
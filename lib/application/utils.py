@@ -4,8 +4,14 @@ Utility functions for GBE Box.
 Common calculations and helper functions.
 """
 
+import micropython
 import time
 
+# Zero-padded two-digit strings for 0-99, built once. Indexing this
+# tuple replaces f-string/%-format parsing everywhere date and time
+# components are rendered - these run on the 1-second program tick.
+TWO_DIGITS = tuple("%02d" % i for i in range(100))
+
 
 class TimeCalculator:
     """Utility functions for time calculations and conversions."""
@@ -49,20 +55,47 @@ class TimeCalculator:
         return total_seconds
     
     @staticmethod
-    def current_time():
-        """Get current time as HH:MM string using proper local time."""
-        from gbebox.clock import clock
-        local_datetime = clock.get_local_datetime_from_utc()
-        hour, minute = local_datetime[3:5]
-        return f"{hour:0>2}:{minute:0>2}"
+    def current_time(now=None):
+        """Get current time as HH:MM string using proper local time.
+
+        Callers that already hold a local datetime tuple can pass it as
+        `now` to skip the timezone conversion.
+        """
+        if now is None:
+            from gbebox.clock import clock
+            now = clock.get_local_datetime_from_utc()
+        return TWO_DIGITS[now[3]] + ":" + TWO_DIGITS[now[4]]
     
     @staticmethod
-    def current_date():
-        """Get current date as YYYY-MM-DD string using proper local time."""
-        from gbebox.clock import clock
-        local_datetime = clock.get_local_datetime_from_utc()
-        year, month, day = local_datetime[:3]
-        return f"{year}-{month:0>2}-{day:0>2}"
+    @micropython.native
+    def date_to_int(date_str):
+        """Convert a YYYY-MM-DD string to the integer year*10000+month*100+day.
+
+        These integers order the same way the date strings do, so range
+        checks become single integer comparisons.
+        """
+        year, month, day = date_str.split('-')
+        return int(year) * 10000 + int(month) * 100 + int(day)
+
+    @staticmethod
+    def current_date_int(now=None):
+        """Get current local date as the integer year*10000+month*100+day."""
+        if now is None:
+            from gbebox.clock import clock
+            now = clock.get_local_datetime_from_utc()
+        return now[0] * 10000 + now[1] * 100 + now[2]
+
+    @staticmethod
+    def current_date(now=None):
+        """Get current date as YYYY-MM-DD string using proper local time.
+
+        Callers that already hold a local datetime tuple can pass it as
+        `now` to skip the timezone conversion.
+        """
+        if now is None:
+            from gbebox.clock import clock
+            now = clock.get_local_datetime_from_utc()
+        return str(now[0]) + "-" + TWO_DIGITS[now[1]] + "-" + TWO_DIGITS[now[2]]
     
     
     @staticmethod
@@ -99,11 +132,36 @@ class TimeCalculator:
         return f"{end_year}-{end_month:0>2}-{end_day:0>2}"
     
     @staticmethod
+    @micropython.native
+    def _to_seconds_of_day(t):
+        """Convert an HH:MM or HH:MM:SS string to integer seconds past midnight."""
+        parts = str(t).split(':')
+        h = int(parts[0])
+        m = int(parts[1]) if len(parts) > 1 else 0
+        s = int(parts[2]) if len(parts) > 2 else 0
+        return h * 3600 + m * 60 + s
+
+    @staticmethod
+    def current_seconds_of_day(now=None):
+        """Get the current local time as integer seconds past midnight.
+
+        Callers that already hold a local datetime tuple can pass it as
+        `now` to skip the timezone conversion.
+        """
+        if now is None:
+            from gbebox.clock import clock
+            now = clock.get_local_datetime_from_utc()
+        return now[3] * 3600 + now[4] * 60 + now[5]
+
+    @staticmethod
+    @micropython.native
     def time_within_range(start_time, end_time):
         """
         Check if current time falls within the specified time range.
         
-        Uses proper local time calculation from UTC base.
+        Uses proper local time calculation from UTC base. The comparison
+        is done on integer seconds-of-day rather than formatted strings,
+        since this runs on every program tick.
         
         Args:
             start_time: Range start time (HH:MM:SS or HH:MM format)
@@ -113,28 +171,16 @@ class TimeCalculator:
             bool: True if current time is within range
         """
         # Get current local time using proper timezone conversion
-        from gbebox.clock import clock
-        local_datetime = clock.get_local_datetime_from_utc()
-        _, _, _, hours, minutes, seconds = local_datetime
-        current_time = f"{hours:0>2}:{minutes:0>2}:{seconds:0>2}"
-        
-        def normalize_time(t):
-            """Normalize time string to HH:MM:SS format."""
-            parts = t.split(":")
-            h = parts[0] if len(parts) > 0 else "00"
-            m = parts[1] if len(parts) > 1 else "00"
-            s = parts[2] if len(parts) > 2 else "00"
-            return f"{h:0>2}:{m:0>2}:{s:0>2}"
-        
-        # Normalize input times
-        start_time = normalize_time(start_time)
-        end_time = normalize_time(end_time)
-        
+        now = TimeCalculator.current_seconds_of_day()
+
+        start = TimeCalculator._to_seconds_of_day(start_time)
+        end = TimeCalculator._to_seconds_of_day(end_time)
+
         # Handle overnight time range (e.g., 22:00 to 06:00)
-        if start_time > end_time:
-            return not (end_time < current_time < start_time)
+        if start > end:
+            return not (end < now < start)
         else:
-            return start_time <= current_time <= end_time
+            return start <= now <= end
 
 
 # Create global instance for backward compatibility
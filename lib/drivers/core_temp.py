@@ -18,6 +18,25 @@ For more information, visit: https://www.fairchildgarden.org/gbe
 import machine
 import time
 
+# The datasheet conversion 27 - (raw*3.3/65535 - 0.706)/0.001721 rearranges
+# to a single multiply and subtract: temperature = _A - raw * _B. Folding
+# the constants at import time cuts the emulated float work per reading
+# (the RP2040 has no hardware floating point).
+_A = 27.0 + 0.706 / 0.001721
+_B = 3.3 / (65535.0 * 0.001721)
+
+# The RP2040 has a single temperature sensor on ADC4; share one ADC
+# object between all CoreTemperature instances instead of building a
+# fresh one per construction
+_adc4 = None
+
+
+def _get_adc():
+    global _adc4
+    if _adc4 is None:
+        _adc4 = machine.ADC(4)
+    return _adc4
+
 
 class CoreTemperature:
     """
@@ -33,11 +52,11 @@ class CoreTemperature:
     def __init__(self):
         """Initialize the core temperature sensor."""
         try:
-            # Initialize ADC4 for internal temperature sensor
-            self._adc = machine.ADC(4)
+            # Initialize (or reuse) ADC4 for the internal temperature sensor
+            self._adc = _get_adc()
             self._last_reading = None
-            self._last_reading_time = 0
-            self._reading_cache_duration = 1.0  # Cache readings for 1 second
+            self._last_reading_ms = time.ticks_ms()
+            self._reading_cache_ms = 1000  # Cache readings for 1 second
             
             print("RP2040 core temperature sensor initialized")
             
@@ -58,27 +77,23 @@ class CoreTemperature:
         if not self._adc:
             return None
         
-        current_time = time.time()
-        
-        # Use cached reading if within cache duration
+        # Use cached reading if within cache duration. ticks_ms/ticks_diff
+        # keep this fast path all-integer (no float math) and wrap-safe.
+        now = time.ticks_ms()
         if (self._last_reading is not None and 
-            current_time - self._last_reading_time < self._reading_cache_duration):
+            time.ticks_diff(now, self._last_reading_ms) < self._reading_cache_ms):
             return self._last_reading
         
         try:
             # Read raw ADC value (0-65535 for 16-bit)
             raw_reading = self._adc.read_u16()
             
-            # Convert to voltage (3.3V reference)
-            voltage = raw_reading * 3.3 / 65535.0
-            
-            # Apply RP2040 temperature conversion formula
-            # Temperature = 27 - (voltage - 0.706) / 0.001721
-            temperature = 27.0 - (voltage - 0.706) / 0.001721
+            # Apply the RP2040 conversion with pre-folded constants
+            temperature = _A - raw_reading * _B
             
             # Cache the reading
             self._last_reading = round(temperature, 1)
-            self._last_reading_time = current_time
+            self._last_reading_ms = now
             
             return self._last_reading
             
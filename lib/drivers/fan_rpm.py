@@ -14,34 +14,63 @@ Date: September 14, 2024
 For more information, visit: https://www.fairchildgarden.org/gbe
 """
 
+import rp2
 from machine import Pin, Timer
 
+
+@rp2.asm_pio()
+def _tach_counter():
+    # Count falling tach edges entirely in a PIO state machine: wait for
+    # the line to go high, then low, then decrement X. The CPU never sees
+    # the individual pulses, so the count stays accurate at any pulse
+    # rate with zero interrupt load. X starts at 0xFFFFFFFF and the CPU
+    # recovers the running edge count as ~X.
+    wait(1, pin, 0)
+    wait(0, pin, 0)
+    jmp(x_dec, "counted")
+    label("counted")
+
+
 class FanRPM:
-    def __init__(self, pin_num, pulses_per_rev=2, calc_interval=1):
+    def __init__(self, pin_num, pulses_per_rev=2, calc_interval=1, sm_id=0):
         self.tach_pin = Pin(pin_num, Pin.IN, Pin.PULL_UP)
         self.pulses_per_rev = pulses_per_rev
         self.calc_interval = calc_interval
-        self.pulse_count = 0
         self.rpm = 0
         self.timer = Timer()
 
-        # Attach the interrupt to the tachometer pin
-        self.tach_pin.irq(trigger=Pin.IRQ_FALLING, handler=self._tachometer_callback)
+        # Pre-encode the two instructions the timer injects to sample the
+        # count, so the periodic callback never parses instruction text
+        self._exec_read = rp2.asm_pio_encode("mov(isr, invert(x))", 0)
+        self._exec_push = rp2.asm_pio_encode("push(noblock)", 0)
+        self._last_total = 0
+
+        # Start the hardware edge counter with X = 0xFFFFFFFF
+        self._sm = rp2.StateMachine(sm_id, _tach_counter, in_base=self.tach_pin)
+        self._sm.exec("mov(x, invert(null))")
+        self._sm.active(1)
 
         # Setup the timer to calculate RPM periodically
         self.timer.init(freq=1/self.calc_interval, mode=Timer.PERIODIC, callback=self._calculate_rpm)
 
-    def _tachometer_callback(self, pin):
-        self.pulse_count += 1
-
     def _calculate_rpm(self, timer):
+        # Sample the hardware counter: isr = ~x gives total edges so far,
+        # and the difference from the previous sample is this interval's
+        # pulse count (modulo arithmetic handles the 32-bit wrap)
+        sm = self._sm
+        sm.exec(self._exec_read)
+        sm.exec(self._exec_push)
+        total = sm.get()
+        pulses = (total - self._last_total) & 0xFFFFFFFF
+        self._last_total = total
+
         # Calculate RPM based on the number of pulses counted
-        self.rpm = int((self.pulse_count / self.pulses_per_rev) * (60 / self.calc_interval))
-        self.pulse_count = 0
+        self.rpm = int((pulses / self.pulses_per_rev) * (60 / self.calc_interval))
 
     def get_rpm(self):
         return self.rpm
 
     def stop(self):
-        # Stop the timer when no longer needed
+        # Stop the timer and the PIO counter when no longer needed
         self.timer.deinit()
+        self._sm.active(0)
@@ -17,8 +17,6 @@ For more information, visit: https://www.fairchildgarden.org/gbe
 """
 
 from micropython import const
-import ustruct
-import json
 from machine import I2C, Pin
 
 # Bits
@@ -85,6 +83,16 @@ _REG_CURRENT = const(0x04)
 _REG_CALIBRATION = const(0x05)
 # pylint: enable=too-few-public-methods
 
+# Config word for set_calibration_32V_2_5A, folded at import time:
+# RANGE_32V<<13 | DIV_8_320MV<<11 | ADCRES_12BIT_128S on both channels
+# | SANDBVOLT_CONTINUOUS
+_INA219_CONFIG_32V_2_5A = const((1 << 13) | (3 << 11) | (0x0F << 7) | (0x0F << 3) | 7)
+
+
+# Parsed RSH value from the hardware-version cache, memoized at module
+# level so a second INA219 instantiation never touches the filesystem
+_cached_rsh = None
+
 
 def _to_signed(num: int) -> int:
     if num > 0x7FFF:
@@ -108,61 +116,105 @@ class INA219:
         self._cal_value = 0
         self._current_lsb = 0
         self._power_lsb = 0
+        self._reg_buf = bytearray(2)  # reused for register reads
+        self._wbuf = bytearray(2)  # reused for register writes
+
+        # Bind the bus methods once; every register access otherwise pays
+        # a self -> i2c_bus -> method dict walk
+        self._read_mem_into = i2c_bus.readfrom_mem_into
+        self._write_mem = i2c_bus.writeto_mem
         self.set_calibration_32V_2_5A()
 
     def _get_cached_rsh_value(self):
         """
         Get RSH value from cached hardware version detection.
         
+        The cache file is ~100 bytes with a known shape, so rather than
+        building a full dict with json.load during boot it is scanned as
+        raw bytes for the detection flag and version string. The parsed
+        value is memoized module-wide.
+        
         Returns:
             float: RSH value from cache, or default 0.0100 if cache not available
         """
-        # RSH values by hardware version
-        rsh_by_version = {
-            "v1.5": 0.0100,
-            "v1.4": 0.0136,
-            "v1.0": 0.0109,
-        }
-        
-        # Try to load cache file
+        global _cached_rsh
+        if _cached_rsh is None:
+            _cached_rsh = self._scan_rsh_cache()
+        return _cached_rsh
+
+    @staticmethod
+    def _scan_rsh_cache():
+        """Scan /cache/hardware_version.json as bytes for the RSH value."""
+        buf = bytearray(256)
         try:
-            with open('/cache/hardware_version.json', 'r') as f:
-                cache_data = json.load(f)
+            with open('/cache/hardware_version.json', 'rb') as f:
+                n = f.readinto(buf)
         except OSError:
             # File doesn't exist - this is normal on first boot
             # print("INA219: No hardware cache found, using default RSH")
             return 0.0100
-        except ValueError:
-            print("INA219: Cache file corrupted, using default RSH")
+        
+        # Only use cache if detection was successful ("detection_successful"
+        # followed by true, whatever the JSON formatter put between them)
+        i = buf.find(b'"detection_successful"', 0, n)
+        if i < 0 or buf.find(b'true', i, i + 32) < 0:
+            print("INA219: Previous detection failed, using default RSH")
             return 0.0100
         
-        # Check if we successfully loaded cache data
-        if cache_data:
-            # Only use cache if detection was successful
-            detection_successful = cache_data.get('detection_successful', False)
-            
-            if detection_successful:
-                version = cache_data.get('version')
-                if version in rsh_by_version:
-                    rsh_value = rsh_by_version[version]
-                    # print(f"INA219: Using RSH={rsh_value} for {version}")
-                    return rsh_value
-                else:
-                    print(f"INA219: Unknown version '{version}' in cache, using default")
-            else:
-                print("INA219: Previous detection failed, using default RSH")
-            
-        # Default to v1.5 value if no valid cache
-        print("INA219: Using default RSH=0.0100")
+        # RSH values by hardware version
+        for version, rsh_value in ((b'"v1.5"', 0.0100),
+                                   (b'"v1.4"', 0.0136),
+                                   (b'"v1.0"', 0.0109)):
+            if buf.find(version, 0, n) >= 0:
+                # print(f"INA219: Using RSH={rsh_value}")
+                return rsh_value
+        
+        print("INA219: Unknown version in cache, using default RSH=0.0100")
         return 0.0100
 
     def _write_register(self, register: int, value: int) -> None:
-        data = ustruct.pack(">H", value)
-        self.i2c_bus.writeto_mem(self.i2c_addr, register, data)
+        # Big-endian pack into a reused buffer - no ustruct, no allocation
+        self._wbuf[0] = (value >> 8) & 0xFF
+        self._wbuf[1] = value & 0xFF
+        self._write_mem(self.i2c_addr, register, self._wbuf)
 
     def _read_register(self, register: int) -> int:
-        data = self.i2c_bus.readfrom_mem(self.i2c_addr, register, 2)
-        return ustruct.unpack(">H", data)[0]
+        buf = self._reg_buf
+        self._read_mem_into(self.i2c_addr, register, buf)
+        return (buf[0] << 8) | buf[1]
+
+    def read_all(self):
+        """Read shunt voltage, bus voltage, power and current in one pass.
+
+        Logging code that wants all four values should call this instead of
+        the individual properties: it reuses one 2-byte buffer, skips the
+        per-read calibration writes, and does four short register reads
+        back to back (the INA219 register pointer does not auto-increment,
+        so each register needs its own pointer write).
+
+        Returns a (shunt_voltage, bus_voltage, power, current) tuple using
+        the same units and thresholds as the matching properties.
+        """
+        buf = self._reg_buf
+        read_into = self._read_mem_into
+        addr = self.i2c_addr
+
+        read_into(addr, _REG_SHUNTVOLTAGE, buf)
+        shunt = _to_signed((buf[0] << 8) | buf[1]) * 0.00001
+
+        read_into(addr, _REG_BUSVOLTAGE, buf)
+        bus = (((buf[0] << 8) | buf[1]) >> 3) * 0.004
+        if bus < 2: bus = 0
+
+        read_into(addr, _REG_POWER, buf)
+        power = ((buf[0] << 8) | buf[1]) * self._power_lsb
+        if power < 1: power = 0
+
+        read_into(addr, _REG_CURRENT, buf)
+        current = _to_signed((buf[0] << 8) | buf[1]) * self._current_lsb * 1000
+        if current < 10: current = 0
+
+        return shunt, bus, power, current
 
     @property
     def shunt_voltage(self) -> float:
@@ -178,7 +230,6 @@ class INA219:
 
     @property
     def current(self) -> float:
-        self._write_register(_REG_CALIBRATION, self._cal_value)
         raw_value = self._read_register(_REG_CURRENT)
         corrected_value = _to_signed(raw_value) * self._current_lsb
         # Convert to mA and apply threshold  
@@ -188,7 +239,6 @@ class INA219:
 
     @property
     def power(self) -> float:
-        self._write_register(_REG_CALIBRATION, self._cal_value)
         raw_value = self._read_register(_REG_POWER)
         corrected_value =  raw_value * self._power_lsb
         if corrected_value < 1: corrected_value = 0
@@ -216,6 +266,4 @@ class INA219:
         self._power_lsb = 20 * self._current_lsb
         
         self._write_register(_REG_CALIBRATION, self._cal_value)
-        config = (BusVoltageRange.RANGE_32V << 13) | (Gain.DIV_8_320MV << 11) | \
-                 (ADCResolution.ADCRES_12BIT_128S << 7) | (ADCResolution.ADCRES_12BIT_128S << 3) | Mode.SANDBVOLT_CONTINUOUS
-        self._write_register(_REG_CONFIG, config)
+        self._write_register(_REG_CONFIG, _INA219_CONFIG_32V_2_5A)
@@ -23,45 +23,123 @@
 # Date: 25 August 2024
 
 
+import array
+import micropython
 import time
 from machine import I2C
 from micropython import const
 
 SCD4X_DEFAULT_ADDR = const(0x62)
-_SCD4X_REINIT = const(0x3646)
-_SCD4X_FACTORYRESET = const(0x3632)
-_SCD4X_FORCEDRECAL = const(0x362F)
-_SCD4X_SELFTEST = const(0x3639)
-_SCD4X_DATAREADY = const(0xE4B8)
-_SCD4X_STOPPERIODICMEASUREMENT = const(0x3F86)
-_SCD4X_STARTPERIODICMEASUREMENT = const(0x21B1)
-_SCD4X_STARTLOWPOWERPERIODICMEASUREMENT = const(0x21AC)
-_SCD4X_READMEASUREMENT = const(0xEC05)
-_SCD4X_SERIALNUMBER = const(0x3682)
-_SCD4X_GETTEMPOFFSET = const(0x2318)
-_SCD4X_SETTEMPOFFSET = const(0x241D)
-_SCD4X_GETALTITUDE = const(0x2322)
-_SCD4X_SETALTITUDE = const(0x2427)
-_SCD4X_SETPRESSURE = const(0xE000)
-_SCD4X_PERSISTSETTINGS = const(0x3615)
-_SCD4X_GETASCE = const(0x2313)
-_SCD4X_SETASCE = const(0x2416)
-_SCD4X_MEASURESINGLESHOT = const(0x219D)
-_SCD4X_MEASURESINGLESHOTRHTONLY = const(0x2196)
+
+# Commands are fixed 16-bit values, so they are stored pre-packed as
+# 2-byte big-endian literals and handed straight to i2c.writeto - no
+# shifting or staging buffer on each send
+_SCD4X_REINIT = b'\x36\x46'
+_SCD4X_FACTORYRESET = b'\x36\x32'
+_SCD4X_FORCEDRECAL = b'\x36\x2f'
+_SCD4X_SELFTEST = b'\x36\x39'
+_SCD4X_DATAREADY = b'\xe4\xb8'
+_SCD4X_STOPPERIODICMEASUREMENT = b'\x3f\x86'
+_SCD4X_STARTPERIODICMEASUREMENT = b'\x21\xb1'
+_SCD4X_STARTLOWPOWERPERIODICMEASUREMENT = b'\x21\xac'
+_SCD4X_READMEASUREMENT = b'\xec\x05'
+_SCD4X_SERIALNUMBER = b'\x36\x82'
+_SCD4X_GETTEMPOFFSET = b'\x23\x18'
+_SCD4X_SETTEMPOFFSET = b'\x24\x1d'
+_SCD4X_GETALTITUDE = b'\x23\x22'
+_SCD4X_SETALTITUDE = b'\x24\x27'
+_SCD4X_SETPRESSURE = b'\xe0\x00'
+_SCD4X_PERSISTSETTINGS = b'\x36\x15'
+_SCD4X_GETASCE = b'\x23\x13'
+_SCD4X_SETASCE = b'\x24\x16'
+_SCD4X_MEASURESINGLESHOT = b'\x21\x9d'
+_SCD4X_MEASURESINGLESHOTRHTONLY = b'\x21\x96'
+
+
+# Pre-folded scale factors for the temperature-offset register (the
+# measurement path itself decodes in fixed point, see _decode_measurement)
+_T_SCALE = 175.0 / 65535.0
+_T_INV = 65535.0 / 175.0
+
+
+def _build_crc_table():
+    # 256-entry lookup table for the sensor's CRC-8 (poly 0x31, init 0xFF),
+    # built once at import so the per-byte CRC is a single table index
+    table = bytearray(256)
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0x31) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+        table[byte] = crc
+    return bytes(table)
+
+
+_CRC_TABLE = _build_crc_table()
+
+
+@micropython.viper
+def _decode_measurement(buf: ptr8, out: ptr32):
+    # Fixed-point decode of a 9-byte measurement reply. The RP2040 has no
+    # FPU, so the datasheet float formulas (-45 + 175*t/65535 etc.) cost
+    # several emulated float ops per read; integer multiply/shift gives the
+    # same tenths resolution in a few machine instructions.
+    out[0] = (buf[0] << 8) | buf[1]  # CO2 in ppm
+    t_raw = (buf[3] << 8) | buf[4]
+    out[1] = ((t_raw * 1750) >> 16) - 450  # tenths of a degree C
+    h_raw = (buf[6] << 8) | buf[7]
+    out[2] = (h_raw * 1000) >> 16  # tenths of a percent RH
+
+
+@micropython.viper
+def _crc8(buf: ptr8, offset: int, length: int) -> int:
+    # Viper-compiled: runs as machine code with raw pointer access, so
+    # each byte costs one XOR and one table lookup instead of an
+    # 8-iteration interpreted bit loop
+    table = ptr8(_CRC_TABLE)
+    crc = 0xFF
+    for i in range(length):
+        crc = table[crc ^ buf[offset + i]]
+    return crc
 
 
 class SCD4X:
     def __init__(self, i2c_bus: I2C, address: int = SCD4X_DEFAULT_ADDR) -> None:
         self.i2c = i2c_bus
         self.address = address
-        self._buffer = bytearray(9)  # Reduced from 18 - only need 9 bytes for data reading
-        self._cmd = bytearray(2)
-        self._crc_buffer = bytearray(2)
 
-        # Cached readings
+        # Bind the bus methods once so each command/reply skips the
+        # self -> i2c -> method attribute walk
+        self._writeto = i2c_bus.writeto
+        self._readfrom_into = i2c_bus.readfrom_into
+        self._buffer = bytearray(9)  # Reduced from 18 - only need 9 bytes for data reading
+        self._decoded = array.array('i', (0, 0, 0))  # co2, temp*10, rh*10
+
+        # Pre-sliced views over the buffer for the three transfer sizes in
+        # use, so reads and writes never create a fresh slice or view object
+        mv = memoryview(self._buffer)
+        self._mv3 = mv[:3]
+        self._mv5 = mv[:5]
+        self._mv9 = mv[:9]
+
+        # Cached readings, shared by all three value properties. The
+        # sensor produces a new measurement every ~5 s, so one data_ready
+        # round-trip per second is plenty; without the window, reading
+        # CO2 + temperature + humidity in sequence costs three.
         self._temperature = None
         self._relative_humidity = None
         self._co2 = None
+        self._data_valid = False
+        self._last_read_ms = time.ticks_ms()
+
+        # The sensor's measurement cadence is known (5 s periodic, 30 s
+        # low-power periodic), so between measurements there is no point
+        # issuing data_ready queries on the bus. _next_ready tracks when
+        # the next sample can possibly exist; it starts due immediately.
+        self._interval_ms = 5000
+        self._next_ready = self._last_read_ms
 
         # Initialize the sensor
         self.stop_periodic_measurement()
@@ -69,43 +147,60 @@ class SCD4X:
         # Disable auto-calibration by default
         self.self_calibration_enabled = False
 
-    @property
-    def CO2(self) -> int:
+    def _refresh(self):
+        # Skip the I2C data_ready query while the cached measurement is
+        # still fresh (within 1 s); otherwise check and read once
+        now = time.ticks_ms()
+        if self._data_valid and time.ticks_diff(now, self._last_read_ms) < 1000:
+            return
+        # No I2C traffic at all until the next measurement can be due
+        if time.ticks_diff(now, self._next_ready) < 0:
+            return
         if self.data_ready:
             self._read_data()
+            self._data_valid = True
+            self._last_read_ms = now
+            self._next_ready = time.ticks_add(now, self._interval_ms)
+
+    def read(self):
+        """Refresh once and return (co2, temperature, relative_humidity)."""
+        self._refresh()
+        return (self._co2, self._temperature, self._relative_humidity)
+
+    @property
+    def CO2(self) -> int:
+        self._refresh()
         return self._co2
 
     @property
     def temperature(self) -> float:
-        if self.data_ready:
-            self._read_data()
+        self._refresh()
         return self._temperature
 
     @property
     def relative_humidity(self) -> float:
-        if self.data_ready:
-            self._read_data()
+        self._refresh()
         return self._relative_humidity
 
     def measure_single_shot(self) -> None:
-        self._send_command(_SCD4X_MEASURESINGLESHOT, cmd_delay=5)
+        self._send_command(_SCD4X_MEASURESINGLESHOT, cmd_delay=5000)
 
     def measure_single_shot_rht_only(self) -> None:
-        self._send_command(_SCD4X_MEASURESINGLESHOTRHTONLY, cmd_delay=0.05)
+        self._send_command(_SCD4X_MEASURESINGLESHOTRHTONLY, cmd_delay=50)
 
     def reinit(self) -> None:
         self.stop_periodic_measurement()
-        self._send_command(_SCD4X_REINIT, cmd_delay=0.02)
+        self._send_command(_SCD4X_REINIT, cmd_delay=20)
 
     def factory_reset(self) -> None:
         self.stop_periodic_measurement()
-        self._send_command(_SCD4X_FACTORYRESET, cmd_delay=1.2)
+        self._send_command(_SCD4X_FACTORYRESET, cmd_delay=1200)
 
     def force_calibration(self, target_co2: int) -> None:
         self.stop_periodic_measurement()
         self._set_command_value(_SCD4X_FORCEDRECAL, target_co2)
-        time.sleep(0.5)
-        self._read_reply(self._buffer, 3)
+        time.sleep_ms(500)
+        self._read_reply(self._mv3)
         correction = (self._buffer[0] << 8) | self._buffer[1]
         if correction == 0xFFFF:
             raise RuntimeError(
@@ -114,41 +209,42 @@ class SCD4X:
 
     @property
     def self_calibration_enabled(self) -> bool:
-        self._send_command(_SCD4X_GETASCE, cmd_delay=0.001)
-        self._read_reply(self._buffer, 3)
+        self._send_command(_SCD4X_GETASCE, cmd_delay=1)
+        self._read_reply(self._mv3)
         return self._buffer[1] == 1
 
     @self_calibration_enabled.setter
     def self_calibration_enabled(self, enabled: bool) -> None:
         self._set_command_value(_SCD4X_SETASCE, 1 if enabled else 0)
-        time.sleep(0.5)  # Ensure the sensor has time to process this change
+        time.sleep_ms(500)  # Ensure the sensor has time to process this change
 
     def self_test(self) -> None:
         self.stop_periodic_measurement()
-        self._send_command(_SCD4X_SELFTEST, cmd_delay=10)
-        self._read_reply(self._buffer, 3)
+        self._send_command(_SCD4X_SELFTEST, cmd_delay=10000)
+        self._read_reply(self._mv3)
         if self._buffer[0] != 0 or self._buffer[1] != 0:
             raise RuntimeError("Self test failed")
 
     def _read_data(self) -> None:
-        self._send_command(_SCD4X_READMEASUREMENT, cmd_delay=0.001)
-        self._read_reply(self._buffer, 9)
-        self._co2 = (self._buffer[0] << 8) | self._buffer[1]
-        temp = (self._buffer[3] << 8) | self._buffer[4]
-        self._temperature = -45 + 175 * (temp / 65535)
-        humi = (self._buffer[6] << 8) | self._buffer[7]
-        self._relative_humidity = 100 * (humi / 65535)
+        self._send_command(_SCD4X_READMEASUREMENT, cmd_delay=1)
+        self._read_reply(self._mv9)
+        _decode_measurement(self._buffer, self._decoded)
+        self._co2 = self._decoded[0]
+        # Decoded values are integer tenths; scale to float only here, at
+        # the API boundary, so the properties keep their existing units
+        self._temperature = self._decoded[1] * 0.1
+        self._relative_humidity = self._decoded[2] * 0.1
 
     @property
     def data_ready(self) -> bool:
-        self._send_command(_SCD4X_DATAREADY, cmd_delay=0.001)
-        self._read_reply(self._buffer, 3)
+        self._send_command(_SCD4X_DATAREADY, cmd_delay=1)
+        self._read_reply(self._mv3)
         return not ((self._buffer[0] & 0x07 == 0) and (self._buffer[1] == 0))
 
     @property
     def serial_number(self):
-        self._send_command(_SCD4X_SERIALNUMBER, cmd_delay=0.001)
-        self._read_reply(self._buffer, 9)
+        self._send_command(_SCD4X_SERIALNUMBER, cmd_delay=1)
+        self._read_reply(self._mv9)
         return (
             self._buffer[0],
             self._buffer[1],
@@ -159,16 +255,20 @@ class SCD4X:
         )
 
     def stop_periodic_measurement(self) -> None:
-        self._send_command(_SCD4X_STOPPERIODICMEASUREMENT, cmd_delay=0.5)
+        self._send_command(_SCD4X_STOPPERIODICMEASUREMENT, cmd_delay=500)
 
     def start_periodic_measurement(self) -> None:
         self._send_command(_SCD4X_STARTPERIODICMEASUREMENT)
+        self._interval_ms = 5000  # new sample every 5 s in this mode
+        self._next_ready = time.ticks_add(time.ticks_ms(), self._interval_ms)
 
     def start_low_periodic_measurement(self) -> None:
         self._send_command(_SCD4X_STARTLOWPOWERPERIODICMEASUREMENT)
+        self._interval_ms = 30000  # new sample every 30 s in this mode
+        self._next_ready = time.ticks_add(time.ticks_ms(), self._interval_ms)
 
     def persist_settings(self) -> None:
-        self._send_command(_SCD4X_PERSISTSETTINGS, cmd_delay=0.8)
+        self._send_command(_SCD4X_PERSISTSETTINGS, cmd_delay=800)
 
     def set_ambient_pressure(self, ambient_pressure: int) -> None:
         if ambient_pressure < 0 or ambient_pressure > 65535:
@@ -177,22 +277,22 @@ class SCD4X:
 
     @property
     def temperature_offset(self) -> float:
-        self._send_command(_SCD4X_GETTEMPOFFSET, cmd_delay=0.001)
-        self._read_reply(self._buffer, 3)
+        self._send_command(_SCD4X_GETTEMPOFFSET, cmd_delay=1)
+        self._read_reply(self._mv3)
         temp = (self._buffer[0] << 8) | self._buffer[1]
-        return temp * 175.0 / 65535
+        return temp * _T_SCALE
 
     @temperature_offset.setter
     def temperature_offset(self, offset: float) -> None:
         if offset > 374:
             raise AttributeError("Offset value must be less than or equal to 374 degrees Celsius")
-        temp = int(offset * 65535 / 175)
+        temp = int(offset * _T_INV)
         self._set_command_value(_SCD4X_SETTEMPOFFSET, temp)
 
     @property
     def altitude(self) -> int:
-        self._send_command(_SCD4X_GETALTITUDE, cmd_delay=0.001)
-        self._read_reply(self._buffer, 3)
+        self._send_command(_SCD4X_GETALTITUDE, cmd_delay=1)
+        self._read_reply(self._mv3)
         return (self._buffer[0] << 8) | self._buffer[1]
 
     @altitude.setter
@@ -201,46 +301,33 @@ class SCD4X:
             raise AttributeError("Height must be less than or equal to 65535 meters")
         self._set_command_value(_SCD4X_SETALTITUDE, height)
 
-    def _check_buffer_crc(self, buf: bytearray) -> bool:
+    def _check_buffer_crc(self, buf) -> bool:
+        # CRC each 2-byte word in place via its offset - no staging copy
         for i in range(0, len(buf), 3):
-            self._crc_buffer[0] = buf[i]
-            self._crc_buffer[1] = buf[i + 1]
-            if self._crc8(self._crc_buffer) != buf[i + 2]:
+            if _crc8(buf, i, 2) != buf[i + 2]:
                 raise RuntimeError("CRC check failed while reading data")
         return True
 
-    def _send_command(self, cmd: int, cmd_delay: float = 0) -> None:
-        self._cmd[0] = (cmd >> 8) & 0xFF
-        self._cmd[1] = cmd & 0xFF
-
+    def _send_command(self, cmd: bytes, cmd_delay: int = 0) -> None:
+        # cmd_delay is integer milliseconds; sleep_ms avoids the float
+        # seconds path and is skipped entirely for zero-delay commands
         try:
-            self.i2c.writeto(self.address, self._cmd)
+            self._writeto(self.address, cmd)
         except OSError as err:
             raise RuntimeError("I2C communication failed") from err
-        time.sleep(cmd_delay)
+        if cmd_delay:
+            time.sleep_ms(cmd_delay)
 
     def _set_command_value(self, cmd, value, cmd_delay=0):
-        self._buffer[0] = (cmd >> 8) & 0xFF
-        self._buffer[1] = cmd & 0xFF
-        self._crc_buffer[0] = self._buffer[2] = (value >> 8) & 0xFF
-        self._crc_buffer[1] = self._buffer[3] = value & 0xFF
-        self._buffer[4] = self._crc8(self._crc_buffer)
-        self.i2c.writeto(self.address, self._buffer[:5])
-        time.sleep(cmd_delay)
-
-    def _read_reply(self, buff, num):
-        mv = memoryview(buff)[:num]
-        self.i2c.readfrom_into(self.address, mv)  # reads exactly `num` bytes
+        self._buffer[0:2] = cmd
+        self._buffer[2] = (value >> 8) & 0xFF
+        self._buffer[3] = value & 0xFF
+        self._buffer[4] = _crc8(self._buffer, 2, 2)
+        self._writeto(self.address, self._mv5)
+        if cmd_delay:
+            time.sleep_ms(cmd_delay)
+
+    def _read_reply(self, mv):
+        self._readfrom_into(self.address, mv)  # reads exactly len(mv) bytes
         self._check_buffer_crc(mv)
 
-    @staticmethod
-    def _crc8(buffer: bytearray) -> int:
-        crc = 0xFF
-        for byte in buffer:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ 0x31
-                else:
-                    crc = crc << 1
-        return crc & 0xFF  # return the bottom 8 bits
@@ -8,8 +8,56 @@ The SHT35 provides high-accuracy temperature (±0.1°C) and humidity (±1.5% RH)
 measurements with excellent long-term stability.
 """
 
+import micropython
 import time
-import struct
+from micropython import const
+
+# Module-level command constants for the internal paths: a module global
+# load is cheaper than the self -> class dict walk of the public class
+# attributes, which stay below as API aliases
+_ADDR_DEFAULT = const(0x44)
+_CMD_MEAS_HIGH = b'\x24\x00'
+_CMD_MEAS_MED = b'\x24\x0b'
+_CMD_MEAS_LOW = b'\x24\x16'
+_CMD_RESET = b'\x30\xa2'
+_CMD_STATUS = b'\xf3\x2d'
+
+
+# Raw-to-physical scale factors, folded once at import so each conversion
+# is a single float multiply plus an add (the RP2040 emulates floats in
+# software, so every saved operation counts)
+_T_SCALE = 175.0 / 65535.0
+_H_SCALE = 100.0 / 65535.0
+
+
+def _build_crc_table():
+    # 256-entry lookup table for the sensor's CRC-8 (poly 0x31, init 0xFF),
+    # built once at import so each CRC byte costs a single table index
+    table = bytearray(256)
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0x31) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+        table[byte] = crc
+    return bytes(table)
+
+
+_CRC8_TABLE = _build_crc_table()
+
+
+@micropython.viper
+def _crc8(buf: ptr8, offset: int, length: int) -> int:
+    # Viper-compiled: native machine code with raw pointer access, so
+    # each byte is one XOR and one table lookup with no interpreter
+    # dispatch (same form as the SCD4x driver)
+    table = ptr8(_CRC8_TABLE)
+    crc = 0xFF
+    for i in range(length):
+        crc = table[crc ^ buf[offset + i]]
+    return crc
 
 
 class SHT35:
@@ -21,23 +69,25 @@ class SHT35:
     """
     
     # Default I2C address
-    DEFAULT_ADDRESS = 0x44
+    DEFAULT_ADDRESS = _ADDR_DEFAULT
     
-    # Command codes for different measurement modes
+    # Command codes for different measurement modes, pre-packed as 2-byte
+    # big-endian literals so sending one is a single writeto with no
+    # struct.pack allocation
     # High repeatability, clock stretching disabled
-    MEASURE_HIGH_REP_NO_STRETCH = 0x2400
+    MEASURE_HIGH_REP_NO_STRETCH = _CMD_MEAS_HIGH
     
     # Medium repeatability, clock stretching disabled  
-    MEASURE_MED_REP_NO_STRETCH = 0x240B
+    MEASURE_MED_REP_NO_STRETCH = _CMD_MEAS_MED
     
     # Low repeatability, clock stretching disabled
-    MEASURE_LOW_REP_NO_STRETCH = 0x2416
+    MEASURE_LOW_REP_NO_STRETCH = _CMD_MEAS_LOW
     
     # Soft reset command
-    SOFT_RESET = 0x30A2
+    SOFT_RESET = _CMD_RESET
     
     # Status register read command
-    READ_STATUS = 0xF32D
+    READ_STATUS = _CMD_STATUS
     
     def __init__(self, i2c, address=DEFAULT_ADDRESS):
         """
@@ -50,53 +100,49 @@ class SHT35:
         self.i2c = i2c
         self.address = address
         
-        # Verify sensor is present and responding
-        self._soft_reset()
-        time.sleep_ms(10)  # Wait for reset to complete
-        
-        # Try to read status to verify communication
+        # One measurement serves both value properties for half a second:
+        # the chip samples temperature and humidity together, and each
+        # measurement costs a ~20 ms blocking wait plus two bus transfers,
+        # so back-to-back property reads should share a single sample
+        self._cache = None
+        self._cache_ts = time.ticks_ms()
+        self._cache_ms = 500
+        
+        # Reused reply buffer (6 bytes for measurements, first 3 for
+        # status) so reads never allocate fresh bytes objects
+        self._buf6 = bytearray(6)
+        self._mv3 = memoryview(self._buf6)[:3]
+        
+        # Verify sensor is present and responding. A healthy sensor from
+        # power-on answers the status read straight away; only reset (and
+        # pay its 10 ms settle) if that first cheap check fails.
         try:
             self._read_status()
-        except (OSError, RuntimeError) as e:
-            raise RuntimeError(f"SHT35 sensor not found at address 0x{address:02X}: {e}")
+        except (OSError, RuntimeError):
+            self._soft_reset()
+            time.sleep_ms(10)  # Wait for reset to complete
+            try:
+                self._read_status()
+            except (OSError, RuntimeError) as e:
+                raise RuntimeError(f"SHT35 sensor not found at address 0x{address:02X}: {e}")
     
     def _write_command(self, command):
-        """Write a command to the sensor."""
-        cmd_bytes = struct.pack('>H', command)
-        self.i2c.writeto(self.address, cmd_bytes)
-    
-    def _read_data(self, num_bytes):
-        """Read data from the sensor."""
-        return self.i2c.readfrom(self.address, num_bytes)
+        """Write a pre-packed command to the sensor."""
+        self.i2c.writeto(self.address, command)
     
     def _soft_reset(self):
         """Perform a soft reset of the sensor."""
-        self._write_command(self.SOFT_RESET)
+        self._write_command(_CMD_RESET)
     
     def _read_status(self):
         """Read the status register."""
-        self._write_command(self.READ_STATUS)
+        self._write_command(_CMD_STATUS)
         time.sleep_ms(1)
-        data = self._read_data(3)  # 2 bytes status + 1 byte CRC
-        return struct.unpack('>H', data[:2])[0]
+        # 2 bytes status + 1 byte CRC, read into the shared buffer
+        self.i2c.readfrom_into(self.address, self._mv3)
+        return (self._buf6[0] << 8) | self._buf6[1]
     
-    def _crc8(self, data):
-        """
-        Calculate CRC8 checksum for data validation.
-        
-        SHT35 uses CRC8 with polynomial 0x31 (x^8 + x^5 + x^4 + 1)
-        """
-        crc = 0xFF
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ 0x31
-                else:
-                    crc = crc << 1
-        return crc & 0xFF
-    
-    def _read_measurement(self, command=MEASURE_HIGH_REP_NO_STRETCH):
+    def _read_measurement(self, command=_CMD_MEAS_HIGH):
         """
         Read temperature and humidity measurement.
         
@@ -113,66 +159,69 @@ class SHT35:
         # High repeatability takes ~15ms, add some margin
         time.sleep_ms(20)
         
-        # Read 6 bytes: temp_high, temp_low, temp_crc, hum_high, hum_low, hum_crc
+        # Read 6 bytes into the shared buffer:
+        # temp_high, temp_low, temp_crc, hum_high, hum_low, hum_crc
+        data = self._buf6
         try:
-            data = self._read_data(6)
+            self.i2c.readfrom_into(self.address, data)
         except OSError as e:
             raise RuntimeError(f"Failed to read measurement data: {e}")
         
-        if len(data) != 6:
-            raise RuntimeError(f"Expected 6 bytes, got {len(data)}")
-        
-        # Extract temperature data and CRC
-        temp_data = data[0:2]
-        temp_crc = data[2]
-        
-        # Extract humidity data and CRC  
-        hum_data = data[3:5]
-        hum_crc = data[5]
-        
-        # Verify CRC checksums
-        if self._crc8(temp_data) != temp_crc:
+        # Verify CRC checksums in place (no slice copies)
+        if _crc8(data, 0, 2) != data[2]:
             raise RuntimeError("Temperature CRC check failed")
         
-        if self._crc8(hum_data) != hum_crc:
+        if _crc8(data, 3, 2) != data[5]:
             raise RuntimeError("Humidity CRC check failed")
         
-        # Convert raw values to temperature and humidity
-        temp_raw = struct.unpack('>H', temp_data)[0]
-        hum_raw = struct.unpack('>H', hum_data)[0]
+        # Convert raw values to temperature and humidity (shift/or is
+        # faster than a tiny struct.unpack and allocates no tuple)
+        temp_raw = (data[0] << 8) | data[1]
+        hum_raw = (data[3] << 8) | data[4]
         
         # Convert to physical values
         # Temperature: -45°C to +130°C mapped to 0x0000 to 0xFFFF
-        temperature = -45 + (175 * temp_raw / 65535)
+        temperature = -45.0 + _T_SCALE * temp_raw
         
         # Humidity: 0% to 100% RH mapped to 0x0000 to 0xFFFF
-        humidity = 100 * hum_raw / 65535
+        humidity = _H_SCALE * hum_raw
         
         # Clamp humidity to valid range
         humidity = max(0, min(100, humidity))
         
         return temperature, humidity
     
+    def _cached_read(self):
+        """Return the cached (temperature, humidity) pair, refreshing it
+        with a real measurement once the cache TTL has passed."""
+        now = time.ticks_ms()
+        if (self._cache is None or
+                time.ticks_diff(now, self._cache_ts) >= self._cache_ms):
+            self._cache = self._read_measurement()
+            self._cache_ts = now
+        return self._cache
+    
     @property
     def temperature(self):
         """Get temperature in degrees Celsius."""
-        temp, _ = self._read_measurement()
-        return temp
+        return self._cached_read()[0]
     
     @property
     def humidity(self):
         """Get relative humidity as percentage."""
-        _, humidity = self._read_measurement()
-        return humidity
+        return self._cached_read()[1]
     
     def read(self):
         """
-        Read both temperature and humidity in one measurement.
+        Read both temperature and humidity in one fresh measurement
+        (and refresh the property cache with it).
         
         Returns:
             tuple: (temperature_c, humidity_percent)
         """
-        return self._read_measurement()
+        self._cache = self._read_measurement()
+        self._cache_ts = time.ticks_ms()
+        return self._cache
     
     def reset(self):
         """Reset the sensor."""
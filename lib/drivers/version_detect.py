@@ -27,6 +27,44 @@ CACHE_DIR = "/cache"
 VERSION_FILE = "/cache/hardware_version.json"
 
 
+# The gbebox package is imported at function level to avoid a circular
+# import at module load; bind it once here on first use
+_gbebox = None
+
+
+def _get_gbebox():
+    global _gbebox
+    if _gbebox is None:
+        import gbebox
+        _gbebox = gbebox
+    return _gbebox
+
+
+def _js(value):
+    """Render a string-or-None field as a JSON value."""
+    if value is None:
+        return "null"
+    return '"' + str(value).replace('"', '\\"') + '"'
+
+
+def _format_cache(cache_data):
+    """Serialize the fixed six-key cache dict to JSON with one %-format.
+
+    The shape never changes, so this replaces a recursive json/jpretty
+    dump with a single string operation. The output stays valid JSON for
+    every reader, including the byte scan in the INA219 driver.
+    """
+    return ('{"version": %s, "detection_successful": %s, '
+            '"detection_method": %s, "detection_timestamp": %s, '
+            '"rsh_value": %s, "notes": %s}' % (
+                _js(cache_data["version"]),
+                "true" if cache_data["detection_successful"] else "false",
+                _js(cache_data["detection_method"]),
+                cache_data["detection_timestamp"],
+                cache_data["rsh_value"],
+                _js(cache_data["notes"])))
+
+
 class VersionDetector:
     """
     Hardware version detection for GBE Box.
@@ -46,72 +84,94 @@ class VersionDetector:
         self.light = light_controller
         self._version = None
         self._rsh_value = None
+        self._cache_dir_ok = False
+        # Parsed cache-file contents, loaded at most once per boot and
+        # shared by every method that consults the cache
+        self._cached_data = None
+        self._cached_data_loaded = False
     
     def _ensure_cache_dir(self):
         """Ensure cache directory exists."""
+        if self._cache_dir_ok:
+            return
         try:
-            if CACHE_DIR not in os.listdir("/"):
-                os.mkdir(CACHE_DIR)
+            # One stat beats listing every name in the root directory
+            os.stat(CACHE_DIR)
         except OSError:
-            pass  # Directory might already exist
+            try:
+                os.mkdir(CACHE_DIR)
+            except OSError:
+                return  # Can't create it; try again next time
+        self._cache_dir_ok = True
     
-    def _load_cached_version(self):
+    def _read_cache_file(self):
         """
-        Load hardware version from cache file.
+        Parse the cache file once per boot and memoize the raw contents.
         
         Returns:
-            dict: Version info with detection details, or None if not cached or detection was unsuccessful
+            dict: Parsed cache contents (legacy text caches are converted
+            and re-saved in the new format), or None if unavailable
         """
+        if self._cached_data_loaded:
+            return self._cached_data
+        self._cached_data_loaded = True
+        
+        # Cheap existence check first: on a never-detected board this
+        # answers with one stat instead of a failed open
+        try:
+            os.stat(VERSION_FILE)
+        except OSError:
+            return None
+        
         try:
             with open(VERSION_FILE, 'r') as f:
                 content = f.read().strip()
+        except OSError:
+            return None
+        
+        # Try to parse as JSON first (new format)
+        try:
+            self._cached_data = json.loads(content)
+        except ValueError:
+            # Fall back to old text format for backward compatibility
+            if content in RSH_BY_CLASS:
+                # Convert old format to new format and re-save
+                cache_data = {
+                    "version": content,
+                    "detection_successful": True,  # Assume old cache was successful
+                    "detection_method": "Legacy cache",
+                    "detection_timestamp": time.time(),
+                    "rsh_value": RSH_BY_CLASS[content],
+                    "notes": "Converted from legacy text cache"
+                }
                 
-                # Try to parse as JSON first (new format)
+                # Re-save in new format  
                 try:
-                    cache_data = json.loads(content)
-                    
-                    # Validate cache structure
-                    if (isinstance(cache_data, dict) and 
-                        'version' in cache_data and 
-                        'detection_successful' in cache_data and
-                        cache_data['version'] in RSH_BY_CLASS):
-                        
-                        # Only use cache if detection was successful
-                        if cache_data['detection_successful']:
-                            return cache_data
-                            
-                except ValueError:
-                    # Fall back to old text format for backward compatibility
-                    if content in RSH_BY_CLASS:
-                        # Convert old format to new format and re-save
-                        cache_data = {
-                            "version": content,
-                            "detection_successful": True,  # Assume old cache was successful
-                            "detection_method": "Legacy cache",
-                            "detection_timestamp": time.time(),
-                            "rsh_value": RSH_BY_CLASS[content],
-                            "notes": "Converted from legacy text cache"
-                        }
-                        
-                        # Re-save in new format  
-                        try:
-                            # Try to use jpretty for better formatting
-                            try:
-                                from json_utils import jpretty
-                                formatted_data = jpretty.jpretty(cache_data)
-                                with open(VERSION_FILE, 'w') as f_write:
-                                    f_write.write(formatted_data)
-                            except ImportError:
-                                # Fall back to standard json if jpretty not available
-                                with open(VERSION_FILE, 'w') as f_write:
-                                    json.dump(cache_data, f_write)
-                        except OSError:
-                            pass
-                            
-                        return cache_data
-                    
-        except (OSError, ValueError):
-            pass
+                    with open(VERSION_FILE, 'w') as f_write:
+                        f_write.write(_format_cache(cache_data))
+                except OSError:
+                    pass
+                
+                self._cached_data = cache_data
+        
+        return self._cached_data
+    
+    def _load_cached_version(self):
+        """
+        Load hardware version from cache file.
+        
+        Returns:
+            dict: Version info with detection details, or None if not cached or detection was unsuccessful
+        """
+        cache_data = self._read_cache_file()
+        
+        # Validate cache structure; only use it if detection was successful
+        if (isinstance(cache_data, dict) and 
+            'version' in cache_data and 
+            'detection_successful' in cache_data and
+            cache_data['version'] in RSH_BY_CLASS and
+            cache_data['detection_successful']):
+            return cache_data
         return None
     
     def _save_version_to_cache(self, version, detection_successful, detection_method=None, notes=None):
@@ -135,16 +195,12 @@ class VersionDetector:
                 "notes": notes
             }
             
-            # Try to use jpretty for better formatting
-            try:
-                from json_utils import jpretty
-                formatted_data = jpretty.jpretty(cache_data)
-                with open(VERSION_FILE, 'w') as f:
-                    f.write(formatted_data)
-            except ImportError:
-                # Fall back to standard json if jpretty not available
-                with open(VERSION_FILE, 'w') as f:
-                    json.dump(cache_data, f)
+            with open(VERSION_FILE, 'w') as f:
+                f.write(_format_cache(cache_data))
+            
+            # Keep the in-memory copy in step with what was written
+            self._cached_data = cache_data
+            self._cached_data_loaded = True
         except OSError:
             pass  # Silently fail if cache can't be written
     
@@ -160,14 +216,17 @@ class VersionDetector:
         if not self.i2c0:
             return False, []
         
-        eeprom_addresses = [0x50, 0x51, 0x52, 0x53]
-        
         try:
-            # Scan I2C bus for EEPROM addresses
-            devices = self.i2c0.scan()
-            
-            # Check which EEPROM addresses are present
-            found_addresses = [addr for addr in eeprom_addresses if addr in devices]
+            # Probe just the four EEPROM addresses instead of scanning the
+            # whole bus: a full scan() walks ~112 addresses, each with its
+            # own START/STOP cycle, on every uncached boot
+            found_addresses = []
+            for addr in (0x50, 0x51, 0x52, 0x53):
+                try:
+                    self.i2c0.writeto(addr, b'')  # address-only probe (ACK test)
+                    found_addresses.append(addr)
+                except OSError:
+                    pass
             
             # Return success if any EEPROM addresses found
             return len(found_addresses) > 0, found_addresses
@@ -191,7 +250,7 @@ class VersionDetector:
         
         try:
             # First check if 24V power is present
-            import gbebox
+            gbebox = _get_gbebox()
             initial_voltage = gbebox.sensor.voltage()
             
             if initial_voltage is None or initial_voltage < 20:
@@ -215,18 +274,32 @@ class VersionDetector:
             # Take power readings with default RSH=0.01 calibration
             # v1.4 boards will read erroneously high (>70W) due to incorrect RSH
             # v1.0 boards will read more accurately (~60-65W)
-            power_readings = []
-            voltage_readings = []
+            # Running sums instead of reading lists: same averages with
+            # no list allocation or second summing pass
+            power_sum = 0.0
+            power_count = 0
+            voltage_sum = 0.0
+            voltage_count = 0
+            
+            # Go straight to the INA219 when it is present: read_all()
+            # collects voltage and power in one pass instead of two
+            # property reads per iteration
+            ina = gbebox.sensor.ina
             
             for i in range(5):
                 try:
-                    power = gbebox.sensor.power()
-                    voltage = gbebox.sensor.voltage()
+                    if ina:
+                        _, voltage, power, _ = ina.read_all()
+                    else:
+                        power = gbebox.sensor.power()
+                        voltage = gbebox.sensor.voltage()
                     
                     if power is not None:
-                        power_readings.append(power)
+                        power_sum += power
+                        power_count += 1
                     if voltage is not None:
-                        voltage_readings.append(voltage)
+                        voltage_sum += voltage
+                        voltage_count += 1
                         
                 except Exception:
                     pass
@@ -236,9 +309,9 @@ class VersionDetector:
             # Restore original LED state
             self.light.rgbw(*original_rgbw)
             
-            if power_readings:
-                avg_power = sum(power_readings) / len(power_readings)
-                avg_voltage = sum(voltage_readings) / len(voltage_readings) if voltage_readings else 0
+            if power_count:
+                avg_power = power_sum / power_count
+                avg_voltage = voltage_sum / voltage_count if voltage_count else 0
                 
                 # Check if we got meaningful power readings (should be >40W with lights on)
                 if avg_power < 40:
@@ -250,8 +323,8 @@ class VersionDetector:
                 else:
                     return "v1.0", True, avg_power, f"Power test successful: {avg_power:.1f}W indicates v1.0"
             else:
-                avg_voltage = sum(voltage_readings) / len(voltage_readings) if voltage_readings else 0
-                return "v1.0", False, 0.0, f"No power readings (voltage readings: {len(voltage_readings)}, avg: {avg_voltage:.1f}V)"
+                avg_voltage = voltage_sum / voltage_count if voltage_count else 0
+                return "v1.0", False, 0.0, f"No power readings (voltage readings: {voltage_count}, avg: {avg_voltage:.1f}V)"
                 
         except Exception as e:
             # Restore LEDs if something went wrong
@@ -325,19 +398,13 @@ class VersionDetector:
         Returns:
             bool: True if detection should be retried
         """
-        try:
-            with open(VERSION_FILE, 'r') as f:
-                cache_data = json.load(f)
-                
-                # Retry if previous detection was unsuccessful
-                if not cache_data.get('detection_successful', True):
-                    return True
-                    
-        except (OSError, ValueError):
+        cache_data = self._read_cache_file()
+        if not isinstance(cache_data, dict):
             # No cache file or invalid format - should detect
             return True
-            
-        return False
+        
+        # Retry if previous detection was unsuccessful
+        return not cache_data.get('detection_successful', True)
     
     
     def force_redetection(self):
@@ -351,11 +418,7 @@ class VersionDetector:
         Returns:
             dict: Detection information or None if no cache exists
         """
-        try:
-            with open(VERSION_FILE, 'r') as f:
-                return json.load(f)
-        except (OSError, ValueError):
-            return None
+        return self._read_cache_file()
 
 
 # Global instance (will be initialized by hardware.py)
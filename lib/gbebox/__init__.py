@@ -43,29 +43,20 @@ def _get_hardware_date():
 
 hardware_date = _get_hardware_date()
 
-# Import all modules to create the unified API
+# Only the hardware layer is imported eagerly: it defines the board
+# pins and I2C/SPI buses everything else is built on. The rest of the
+# API (sensors, lights, SD card, WiFi, clock, program engine) is loaded
+# on first use via __getattr__ at the bottom of this file, so a program
+# that only reads sensors never pays RAM or boot time for networking
+# and logging code.
+import sys
+
 from .hardware import (
     board, i2c0, i2c1, spi0, led, usb_connected, board_config,
     detect_and_configure_hardware, get_hardware_info, force_hardware_redetection,
     system
 )
 
-from .sensors import sensor
-
-from .actuators import light, fan
-
-
-from .indicator import indicator
-
-from .storage import sd
-
-from .networking import wifi, wlan
-
-from .clock import clock
-
-# Import application logic and utilities
-from application import calc, Run, ProgramEngine, WatchdogManager, GarbageCollector, DataLogger
-
 # Import built-in libraries commonly used by student programs
 import time
 import uasyncio as asyncio
@@ -101,7 +92,7 @@ __all__ = [
     'Run', 'ProgramEngine',
     
     # Version info
-    'software_date', 'hardware_date',
+    'software_date', 'hardware_date', 'print_banner',
     
     # Common imports for convenience
     'time', 'asyncio'
@@ -111,6 +102,7 @@ __all__ = [
 def get_system_info():
     """Get system information including memory usage."""
     import gc
+    from .sensors import sensor
     memory_info = sensor.get_memory_usage()
     return {
         'software_date': software_date,
@@ -119,6 +111,44 @@ def get_system_info():
         'sensors_available': len(sensor.get_available_sensors())
     }
 
-# Print initialization message when imported
-# print(f"GBE Box Library loaded - Software date: {software_date}")
-# print("Hardware abstraction initialized")
\ No newline at end of file
+def print_banner():
+    """Print the library banner (run from the REPL if you want it).
+
+    This used to print on every import, but UART writes are blocking on
+    MicroPython, so the banner cost every student program a few
+    milliseconds of boot time. Now it only prints when asked.
+    """
+    print(f"GBE Box Library loaded - Software date: {software_date}")
+    print("Hardware abstraction initialized")
+
+
+# Lazy-load table: public name -> (module, attribute). The first access
+# to e.g. gbebox.sd imports the module and stores the object back into
+# this package's globals, so every later lookup is an ordinary dict hit.
+_LAZY = {
+    'sensor': ('gbebox.sensors', 'sensor'),
+    'light': ('gbebox.actuators', 'light'),
+    'fan': ('gbebox.actuators', 'fan'),
+    'indicator': ('gbebox.indicator', 'indicator'),
+    'sd': ('gbebox.storage', 'sd'),
+    'wifi': ('gbebox.networking', 'wifi'),
+    'wlan': ('gbebox.networking', 'wlan'),
+    'clock': ('gbebox.clock', 'clock'),
+    'calc': ('application', 'calc'),
+    'Run': ('application', 'Run'),
+    'ProgramEngine': ('application', 'ProgramEngine'),
+    'WatchdogManager': ('application', 'WatchdogManager'),
+    'GarbageCollector': ('application', 'GarbageCollector'),
+    'DataLogger': ('application', 'DataLogger'),
+}
+
+
+def __getattr__(name):
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(name)
+    module_name, attr = spec
+    __import__(module_name)
+    value = getattr(sys.modules[module_name], attr)
+    globals()[name] = value
+    return value
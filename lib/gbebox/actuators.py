@@ -6,9 +6,21 @@ Addresses static/instance method inconsistencies from original design.
 """
 
 import time
+import micropython
 import uasyncio as asyncio
 from machine import Pin, PWM
-from .hardware import board
+from .hardware import pins
+
+
+@micropython.viper
+def _clamp(v: int, limit: int) -> int:
+    # Native-code clamp shared by the light and fan setters: the
+    # comparisons run as machine instructions instead of bytecode
+    if v < 0:
+        return 0
+    if v > limit:
+        return limit
+    return v
 
 
 class LightController:
@@ -19,12 +31,19 @@ class LightController:
     instead of the original static method approach.
     """
     
+    # Stabilization waits used by set_rgbw_with_power_target(), in
+    # seconds. Class-level knobs so advanced users can shorten them if
+    # their power supply settles faster than the stock one.
+    STABILIZE_INITIAL_S = 3.0
+    STABILIZE_STEP_S = 2.5
+    POWER_RETRY_S = 0.5
+    
     def __init__(self):
         # Initialize PWM channels for each LED color
-        self._rpwm = PWM(Pin(board["pins"]["red"]))
-        self._gpwm = PWM(Pin(board["pins"]["green"]))
-        self._bpwm = PWM(Pin(board["pins"]["blue"]))
-        self._wpwm = PWM(Pin(board["pins"]["white"]))
+        self._rpwm = PWM(Pin(pins.red))
+        self._gpwm = PWM(Pin(pins.green))
+        self._bpwm = PWM(Pin(pins.blue))
+        self._wpwm = PWM(Pin(pins.white))
         
         # Set PWM frequencies
         self._rpwm.freq(20000)
@@ -46,63 +65,129 @@ class LightController:
             'white': 196
         }
         
+        # Channel table indexed 0-3 = R, G, B, W, plus a shadow copy of
+        # the last-written values: getters answer from the shadow instead
+        # of reading the PWM peripheral back and dividing
+        self._channels = (
+            (self._rpwm, self._limits['red']),
+            (self._gpwm, self._limits['green']),
+            (self._bpwm, self._limits['blue']),
+            (self._wpwm, self._limits['white']),
+        )
+        self._duty = [0, 0, 0, 0]
+        
         # Power-based control state tracking
         self._last_power_target = None
         self._last_power_result = None
+        
+        # Sensor manager, resolved on first use (function-level import
+        # avoids a circular import at module load; memoizing it means
+        # only the first power-target call pays for the lookup)
+        self._sensor = None
+    
+    @micropython.native
+    def _set(self, i, value):
+        """Clamp and write one channel, keeping the shadow copy in step.
+        
+        The clamp runs in the viper helper above, and an unchanged value
+        skips the duty_u16 write entirely - in a slow fade most ticks
+        leave three of the four channels where they were.
+        """
+        pwm, limit = self._channels[i]
+        v = _clamp(int(value), limit)
+        if v != self._duty[i]:
+            pwm.duty_u16(v << 8)
+            self._duty[i] = v
+        return v
     
     def red(self, value=None):
-        """Set or get red channel value (0-160)."""
+        """Set or get red channel value."""
         if value is not None:
-            clamped = int(min(self._limits['red'], max(0, value)))
-            self._rpwm.duty_u16(clamped * 256)
-        return round(self._rpwm.duty_u16() / 256)
+            self._set(0, value)
+        return self._duty[0]
     
     def green(self, value=None):
-        """Set or get green channel value (0-71)."""
+        """Set or get green channel value."""
         if value is not None:
-            clamped = int(min(self._limits['green'], max(0, value)))
-            self._gpwm.duty_u16(clamped * 256)
-        return round(self._gpwm.duty_u16() / 256)
+            self._set(1, value)
+        return self._duty[1]
     
     def blue(self, value=None):
-        """Set or get blue channel value (0-75)."""
+        """Set or get blue channel value."""
         if value is not None:
-            clamped = int(min(self._limits['blue'], max(0, value)))
-            self._bpwm.duty_u16(clamped * 256)
-        return round(self._bpwm.duty_u16() / 256)
+            self._set(2, value)
+        return self._duty[2]
     
     def white(self, value=None):
-        """Set or get white channel value (0-117)."""
+        """Set or get white channel value."""
         if value is not None:
-            clamped = int(min(self._limits['white'], max(0, value)))
-            self._wpwm.duty_u16(clamped * 256)
-        return round(self._wpwm.duty_u16() / 256)
+            self._set(3, value)
+        return self._duty[3]
     
+    @micropython.native
     def rgbw(self, r=None, g=None, b=None, w=None):
         """Set or get all RGBW channels at once."""
-        if r is not None:
-            self.red(r)
-        if g is not None:
-            self.green(g)
-        if b is not None:
-            self.blue(b)
-        if w is not None:
-            self.white(w)
-            
+        changed = False
+        i = 0
+        for value in (r, g, b, w):
+            if value is not None:
+                self._set(i, value)
+                changed = True
+            i += 1
+        
         # Clear power control cache when manually setting PWM values
-        if r is not None or g is not None or b is not None or w is not None:
+        if changed:
             self._last_power_target = None
             self._last_power_result = None
         
-        return (self.red(), self.green(), self.blue(), self.white())
+        duty = self._duty
+        return (duty[0], duty[1], duty[2], duty[3])
     
+    @micropython.native
+    def rgbw_set(self, r, g, b, w):
+        """Set all four channels without building the echo tuple.
+
+        Same writes as rgbw(), but for callers that don't need the
+        values echoed back - animation loops and on()/off() - this
+        skips the return-tuple allocation entirely.
+        """
+        self._set(0, r)
+        self._set(1, g)
+        self._set(2, b)
+        self._set(3, w)
+        
+        # Clear power control cache when manually setting PWM values
+        self._last_power_target = None
+        self._last_power_result = None
+    
+    def apply(self, preset):
+        """Apply a 4-byte RGBW preset (e.g. b'\\x78\\x28\\x3c\\x50') in one call.
+
+        Fast path for fixed color recipes: skips the per-channel dispatch
+        and duty read-back that rgbw() does and writes the four PWM duty
+        values directly. Channel values are clamped to the same hardware
+        limits as the individual setters.
+        """
+        duty = self._duty
+        for i in range(4):
+            pwm, limit = self._channels[i]
+            v = preset[i]
+            if v > limit:
+                v = limit
+            pwm.duty_u16(v * 256)
+            duty[i] = v
+
+        # Clear power control cache when manually setting PWM values
+        self._last_power_target = None
+        self._last_power_result = None
+
     def on(self, r=8, g=0, b=24, w=92):
         """Turn lights on with default or specified RGBW values."""
-        self.rgbw(r, g, b, w)
+        self.rgbw_set(r, g, b, w)
     
     def off(self):
         """Turn all lights off."""
-        self.rgbw(0, 0, 0, 0)
+        self.rgbw_set(0, 0, 0, 0)
     
     async def set_rgbw_with_power_target(self, r, g, b, w, target_watts, tolerance=0.5, max_iterations=5):
         """
@@ -120,8 +205,12 @@ class LightController:
         Returns:
             dict: Results with final PWM values, actual power, and success status
         """
-        # Check if we already have a successful result for this target
-        if (self._last_power_target == target_watts and 
+        # Check if we already have a successful result close enough to
+        # this target: callers sweeping targets in small steps (50.0,
+        # 50.1, ...) shouldn't redo the multi-second convergence loop
+        # for a difference the tolerance would have accepted anyway
+        if (self._last_power_target is not None and
+            abs(self._last_power_target - target_watts) <= tolerance and
             self._last_power_result is not None and 
             self._last_power_result.get('success', False)):
             
@@ -148,7 +237,10 @@ class LightController:
         
         # Check if power sensor is available and initial conditions
         try:
-            from gbebox.sensors import sensor
+            if self._sensor is None:
+                from gbebox.sensors import sensor
+                self._sensor = sensor
+            sensor = self._sensor
             
             # Check voltage first - need sufficient power supply
             voltage = sensor.voltage()
@@ -201,7 +293,7 @@ class LightController:
         self.rgbw(current_r, current_g, current_b, current_w)
         
         # Wait for initial stabilization
-        await asyncio.sleep(3.0)
+        await asyncio.sleep(self.STABILIZE_INITIAL_S)
         
         for iteration in range(max_iterations):
             # Get actual power consumption with multiple attempts
@@ -213,9 +305,9 @@ class LightController:
                         actual_power = reading
                         break
                     else:
-                        await asyncio.sleep(0.5)  # Brief wait between attempts
+                        await asyncio.sleep(self.POWER_RETRY_S)  # Brief wait between attempts
                 except Exception:
-                    await asyncio.sleep(0.5)
+                    await asyncio.sleep(self.POWER_RETRY_S)
             
             if actual_power is None or actual_power <= 0:
                 result = {
@@ -276,7 +368,7 @@ class LightController:
                 
                 # Apply new PWM values for next iteration
                 self.rgbw(current_r, current_g, current_b, current_w)
-                await asyncio.sleep(2.5)  # Wait for stabilization
+                await asyncio.sleep(self.STABILIZE_STEP_S)  # Wait for stabilization
         
         # Maximum iterations reached
         result = {
@@ -302,16 +394,23 @@ class FanController:
     """
     
     def __init__(self):
-        self._pwm = PWM(Pin(board["pins"]["fan"]))
+        self._pwm = PWM(Pin(pins.fan))
         self._pwm.freq(20000)
         self._pwm.duty_u16(0)
+        
+        # Shadow of the last-written speed so getters answer from Python
+        # state instead of reading the PWM peripheral back (same pattern
+        # as LightController)
+        self._duty = 0
     
     def setting(self, speed=None):
         """Set or get fan speed (0-255)."""
         if speed is not None:
-            clamped = int(min(255, max(0, speed)))
-            self._pwm.duty_u16(clamped * 256)
-        return round(self._pwm.duty_u16() / 256)
+            clamped = _clamp(int(speed), 255)
+            if clamped != self._duty:
+                self._pwm.duty_u16(clamped << 8)
+                self._duty = clamped
+        return self._duty
     
     def on(self, speed=96):
         """Turn fan on with default or specified speed."""
@@ -328,6 +427,17 @@ class FanController:
     
 
 
-# Create global instances for backward compatibility
-light = LightController()
-fan = FanController()
\ No newline at end of file
+# Create the global instances lazily (module __getattr__): importing
+# gbebox shouldn't pay for five PWM peripheral setups in a program that
+# only reads sensors. The first access to `light` or `fan` builds the
+# controller and stores it as a real module attribute, so every later
+# lookup is an ordinary dict hit.
+def __getattr__(name):
+    if name == 'light':
+        value = LightController()
+    elif name == 'fan':
+        value = FanController()
+    else:
+        raise AttributeError(name)
+    globals()[name] = value
+    return value
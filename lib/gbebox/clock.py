@@ -26,7 +26,28 @@ class ClockManager:
         self._is_set = False
         self._ntp_synced = False
         self._i2c_rtc_available = False
-        
+
+        # Short-lived cache for get_current_datetime() - see that method
+        self._datetime_cache = None
+        self._datetime_cache_ms = 0
+
+        # Parsed UTC offset in seconds; None means "read timezone.json
+        # again". Refreshed once per day by setdaily() and whenever the
+        # timezone is changed manually.
+        self._utc_offset_cached = None
+
+        # Memo for UTC -> local conversion (mktime/localtime walk
+        # calendar arithmetic, so skip them when the input repeats)
+        # and a one-second cache of the last I2C RTC read
+        self._conv_last_utc = None
+        self._conv_last_local = None
+        self._utc_cache = None
+        self._utc_cache_ms = 0
+
+        # WLAN object, resolved on first ntp_sync (function-level import
+        # avoids a circular import at module load)
+        self._wlan = None
+
         self._initialize_rtc()
     
     def _initialize_rtc(self):
@@ -57,8 +78,9 @@ class ClockManager:
             return False
         
         try:
-            # Get UTC time from I2C RTC
-            utc_time = [x for x in self._i2c_rtc.DateTime()]
+            # Get UTC time from I2C RTC (already a sequence - index it
+            # directly instead of copying it into a new list)
+            utc_time = self._i2c_rtc.DateTime()
             # I2C RTC format: (year, month, day, weekday, hour, minute, second, subsecond)
 
             # Extract components (skip weekday at position 3)
@@ -78,6 +100,7 @@ class ClockManager:
                 local_time[3], local_time[4], local_time[5], 0
             ]
             machine.RTC().datetime(local_rtc_time)
+            self._datetime_cache = None  # MCU time changed - drop the cache
             return True
         except Exception as e:
             print(f"RTC sync from UTC error: {e}")
@@ -138,8 +161,10 @@ class ClockManager:
             bool: True if NTP sync successful
         """
         # Check if WiFi is connected before attempting NTP sync
-        from .networking import wlan
-        if not wlan.isconnected():
+        if self._wlan is None:
+            from .networking import wlan
+            self._wlan = wlan
+        if not self._wlan.isconnected():
             return False
             
         try:
@@ -164,6 +189,7 @@ class ClockManager:
                 local_time[3], local_time[4], local_time[5], 0
             ]
             machine.RTC().datetime(local_rtc_time)
+            self._datetime_cache = None  # MCU time changed - drop the cache
             
             self._ntp_synced = True
             
@@ -251,16 +277,14 @@ class ClockManager:
         """
         while True:
             if utc_offset is None:
-                # Import here to avoid circular dependency
-                from .storage import sd
-                timezone_config = sd.tz_file
-                if timezone_config:
-                    offset_str = timezone_config.get("time zone", {}).get("UTC offset", "0")
-                    utc_offset = calc.to_seconds(offset_str)
-                else:
-                    utc_offset = 0
+                # Timezone file may have changed since yesterday -
+                # drop the cached offset so it is parsed fresh once
+                self._utc_offset_cached = None
+                offset = self.get_utc_offset()
+            else:
+                offset = utc_offset
             
-            self.set_time(utc_offset)
+            self.set_time(offset)
             await asyncio.sleep(86400)  # 24 hours
     
     async def set_daily(self, utc_offset=None):
@@ -283,19 +307,39 @@ class ClockManager:
         return (dt[4], dt[5], dt[6])
     
     def get_current_datetime(self):
-        """Get current date and time as (year, month, day, hour, minute, second) tuple."""
+        """Get current date and time as (year, month, day, hour, minute, second) tuple.
+
+        The tuple is cached for one second, so the many callers that ask
+        for "now" within the same control cycle share a single RTC read
+        and a single tuple instead of each paying for their own. The TTL
+        uses time.ticks_ms/ticks_diff (pure integer math - no floats).
+        """
+        now = time.ticks_ms()
+        if (self._datetime_cache is not None and
+                time.ticks_diff(now, self._datetime_cache_ms) < 1000):
+            return self._datetime_cache
         dt = machine.RTC().datetime()
-        return (dt[0], dt[1], dt[2], dt[4], dt[5], dt[6])
+        self._datetime_cache = (dt[0], dt[1], dt[2], dt[4], dt[5], dt[6])
+        self._datetime_cache_ms = now
+        return self._datetime_cache
     
     def get_utc_offset(self):
-        """Get the current UTC offset in seconds from timezone configuration."""
+        """Get the current UTC offset in seconds from timezone configuration.
+
+        The parsed value is cached, so repeated UTC/local conversions
+        don't re-read and re-parse timezone.json every call.
+        """
+        if self._utc_offset_cached is not None:
+            return self._utc_offset_cached
         from .storage import sd
         timezone_config = sd.tz_file
         if timezone_config:
             offset_str = timezone_config.get("time zone", {}).get("UTC offset", "0")
-            from application.utils import calc
-            return calc.to_seconds(offset_str)
-        return 0
+            offset = calc.to_seconds(offset_str)
+        else:
+            offset = 0
+        self._utc_offset_cached = offset
+        return offset
     
     def get_utc_datetime(self):
         """
@@ -317,9 +361,17 @@ class ClockManager:
             utc_time = time.localtime(utc_timestamp)
             return (utc_time[0], utc_time[1], utc_time[2], utc_time[3], utc_time[4], utc_time[5])
         
+        # Reuse the last I2C RTC read for up to a second - pollers that
+        # ask several times per control cycle share one bus transaction
+        now = time.ticks_ms()
+        if (self._utc_cache is not None and
+                time.ticks_diff(now, self._utc_cache_ms) < 1000):
+            return self._utc_cache
         try:
-            utc_time = [x for x in self._i2c_rtc.DateTime()]
-            return (utc_time[0], utc_time[1], utc_time[2], utc_time[4], utc_time[5], utc_time[6])
+            utc_time = self._i2c_rtc.DateTime()
+            self._utc_cache = (utc_time[0], utc_time[1], utc_time[2], utc_time[4], utc_time[5], utc_time[6])
+            self._utc_cache_ms = now
+            return self._utc_cache
         except Exception as e:
             print(f"Error reading UTC time from I2C RTC: {e}")
             return None
@@ -341,11 +393,20 @@ class ClockManager:
             # Fallback to MCU time (already local)
             return self.get_current_datetime()
         
-        utc_timestamp = time.mktime(tuple(utc_datetime[:6]) + (0, 0))
+        # Same input as last time means the same answer - skip the
+        # mktime/localtime calendar math entirely
+        utc_key = tuple(utc_datetime[:6])
+        if utc_key == self._conv_last_utc:
+            return self._conv_last_local
+        
+        utc_timestamp = time.mktime(utc_key + (0, 0))
         offset = self.get_utc_offset()
         local_timestamp = utc_timestamp + offset
         local_time = time.localtime(local_timestamp)
-        return (local_time[0], local_time[1], local_time[2], local_time[3], local_time[4], local_time[5])
+        local = (local_time[0], local_time[1], local_time[2], local_time[3], local_time[4], local_time[5])
+        self._conv_last_utc = utc_key
+        self._conv_last_local = local
+        return local
 
     def _read_manual_time_setting(self):
         """
@@ -467,6 +528,7 @@ class ClockManager:
 
                     # Reload timezone config in storage manager
                     sd.load_settings()
+                    self._utc_offset_cached = None  # offset changed
 
                     print(f"Updated timezone to UTC{utc_offset_hours:+.1f}")
                 except Exception as e:
@@ -479,6 +541,7 @@ class ClockManager:
             weekday = time.localtime(time.mktime((year, month, day, hour, minute, second, 0, 0)))[6]
             local_rtc_time = [year, month, day, weekday, hour, minute, second, 0]
             machine.RTC().datetime(local_rtc_time)
+            self._datetime_cache = None  # MCU time changed - drop the cache
 
             # Set I2C RTC to UTC time
             if self._i2c_rtc_available:
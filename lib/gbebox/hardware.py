@@ -5,11 +5,44 @@ Manages board configuration, pin definitions, and hardware interfaces.
 """
 
 import machine
+import micropython
+from micropython import const
 from machine import Pin, I2C, SPI
 import json
 import ubinascii
 import network
 
+# USB controller SIE_STATUS register (RP2040 datasheet 4.1.4) and the
+# connect/suspend bits we test against, folded at import time
+_SIE_STATUS = const(0x50110050)
+_USB_CONNECTED = const(1 << 16)
+_USB_MASK = const((1 << 16) | (1 << 4))  # CONNECTED | SUSPENDED
+
+
+@micropython.viper
+def _usb_status() -> int:
+    # One native MMIO load + mask instead of interpreted mem32 indexing
+    return ptr32(_SIE_STATUS)[0] & int(_USB_MASK)
+
+
+class _BoardPins:
+    """Pin numbers from board.json, pre-resolved to plain attributes.
+
+    Reading `pins.red` is one attribute load where
+    `board["pins"]["red"]` is two dict probes, and the flat slotted
+    object is smaller on the heap than the nested dict it mirrors.
+    The board["pins"] dict stays as-is for student code and boot.py.
+    """
+    __slots__ = ('red', 'green', 'blue', 'white', 'fan', 'rpm',
+                 'neopixel', 'aux', 'led', 'sdcard_cd',
+                 'i2c0_sda', 'i2c0_scl', 'i2c1_sda', 'i2c1_scl',
+                 'spi0_sck', 'spi0_mosi', 'spi0_miso', 'spi0_cs_sdcard',
+                 'spi1_sck', 'spi1_mosi', 'spi1_miso', 'spi1_cs_connector')
+
+    def __init__(self, pin_map):
+        for name in self.__slots__:
+            setattr(self, name, pin_map.get(name))
+
 
 class BoardConfig:
     """Manages board configuration and hardware interfaces."""
@@ -63,12 +96,7 @@ class BoardConfig:
     
     def usb_connected(self):
         """Check if USB port is connected to a computer."""
-        SIE_STATUS = 0x50110000 + 0x50
-        CONNECTED = 1 << 16
-        SUSPENDED = 1 << 4
-        
-        status = machine.mem32[SIE_STATUS] & (CONNECTED | SUSPENDED)
-        return status == CONNECTED
+        return _usb_status() == _USB_CONNECTED
     
     
     
@@ -76,6 +104,9 @@ class BoardConfig:
 # Create global board instance
 board_config = BoardConfig()
 
+# Flat pin attributes for in-tree modules (see _BoardPins)
+pins = _BoardPins(board_config.config.get("pins", {}))
+
 # Export for backward compatibility
 board = {
     "model": board_config.config.get("model"),
@@ -7,7 +7,7 @@ Manages the NeoPixel status LED with consistent instance-based API.
 import uasyncio as asyncio
 import neopixel
 from machine import Pin
-from .hardware import board
+from .hardware import pins
 
 
 class StatusIndicator:
@@ -29,25 +29,44 @@ class StatusIndicator:
     }
     
     def __init__(self):
-        self._np = neopixel.NeoPixel(Pin(board["pins"]["neopixel"]), 1)
+        self._np = neopixel.NeoPixel(Pin(pins.neopixel), 1)
+
+        # Pre-build the byte pattern for each color once, in the GRB order
+        # the NeoPixel buffer uses on the wire. on()/off() then copy these
+        # bytes straight into the existing buffer with no per-call allocation.
+        self._color_bytes = {}
+        for name, rgb in self.COLORS.items():
+            r, g, b = (int(c * 255) for c in rgb)
+            self._color_bytes[name] = bytes((g, r, b))
+
+        # Last color shown, so repeated on() calls with the same color can
+        # skip the NeoPixel write entirely. Each write bit-bangs the LED
+        # with interrupts disabled to meet WS2812 timing, so skipping
+        # redundant ones keeps I2C and serial traffic jitter-free.
+        self._last = None
+
         self.off()  # Start with LED off
-    
+
     def on(self, color="white"):
         """Turn on the indicator with specified color."""
-        if color in self.COLORS:
-            rgb_values = tuple(int(rgb * 255) for rgb in self.COLORS[color])
-            self._np[0] = rgb_values
+        if color == self._last:
+            return  # LED is already showing this color
+        if color in self._color_bytes:
+            self._last = color
+            self._np.buf[0:3] = self._color_bytes[color]
             self._np.write()
-    
+
     def off(self):
         """Turn off the indicator."""
-        self._np[0] = (0, 0, 0)
+        self._last = None
+        self._np.buf[0:3] = b'\x00\x00\x00'
         self._np.write()
     
     async def pulse(self, color="white", duration=2):
         """Create a breathing/pulse effect with the specified color."""
         if color not in self.COLORS:
             color = "white"
+        self._last = None  # pulse writes the buffer directly
         
         steps = 255
         step_duration = duration / (2 * steps)
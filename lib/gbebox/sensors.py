@@ -6,8 +6,9 @@ Addresses the static/instance method inconsistencies from the original design.
 """
 
 import time
+import array
 import uasyncio as asyncio
-from .hardware import board, i2c0, i2c1
+from .hardware import pins, i2c0, i2c1
 
 
 def load_libraries(library_names):
@@ -80,6 +81,33 @@ class SensorReading:
         return self._device
 
 
+# Fixed field order shared by all_values() and SensorSnapshot. Pairing this
+# with zip() lets callers walk a reading set without building a dict.
+SCHEMA = ("temperature", "humidity", "co2", "pressure", "lux",
+          "voltage", "current", "power", "fan_speed", "moisture")
+
+
+class SensorSnapshot:
+    """All sensor readings collected in a single pass.
+
+    Returned by SensorManager.read_all() so a control or logging cycle can
+    read every sensor once and reuse the values without extra I2C traffic.
+    """
+
+    def __init__(self, temperature, humidity, co2, pressure, lux,
+                 voltage, current, power, fan_speed, moisture):
+        self.temperature = temperature
+        self.humidity = humidity
+        self.co2 = co2
+        self.pressure = pressure
+        self.lux = lux
+        self.voltage = voltage
+        self.current = current
+        self.power = power
+        self.fan_speed = fan_speed
+        self.moisture = moisture
+
+
 class SensorManager:
     """
     Unified sensor management class.
@@ -95,6 +123,18 @@ class SensorManager:
 
         self._sensors = {}
         self._last_i2c1_scan = []  # Track detected I2C1 devices for hot-plug detection
+
+        # Cached snapshot from read_all() with its capture time
+        self._snapshot = None
+        self._snapshot_ms = 0
+
+        # Moving-average window for temperature readings. array.array keeps
+        # the samples in one pre-allocated buffer, so the filter adds no
+        # garbage-collector load on the control path.
+        self._temp_window = array.array('f', [0.0] * 8)
+        self._temp_window_idx = 0
+        self._temp_window_count = 0
+
         self._initialize_sensors()
 
     def _initialize_sensor(self, module_name, sensor_class_name, *args, **kwargs):
@@ -149,7 +189,7 @@ class SensorManager:
         # Fan RPM (special case - not from a library module)
         if sensor_libs['drivers.fan_rpm']:
             self._sensors['rpm'] = sensor_libs['drivers.fan_rpm'].FanRPM(
-                pin_num=board["pins"]["rpm"]
+                pin_num=pins.rpm
             )
         else:
             self._sensors['rpm'] = None
@@ -199,39 +239,63 @@ class SensorManager:
         except (RuntimeError, OSError) as e:
             print(f"SCD4x reinitialization failed: {e}")
 
+    def _smooth_temperature(self, value):
+        """Fold a raw reading into the moving-average window and return the mean.
+
+        A single noisy sample can flip fan/heater decisions in control
+        programs, so temperature readings are averaged over the last 8
+        samples. Failed reads (None) leave the window untouched.
+        """
+        if value is None:
+            return None
+
+        self._temp_window[self._temp_window_idx] = value
+        self._temp_window_idx = (self._temp_window_idx + 1) & 7
+        if self._temp_window_count < 8:
+            self._temp_window_count += 1
+
+        total = 0.0
+        for i in range(self._temp_window_count):
+            total += self._temp_window[i]
+        return round(total / self._temp_window_count, 1)
+
     @property
     def temperature(self):
-        """Get temperature reading from best available sensor."""
+        """Get temperature reading (moving average) from best available sensor."""
         # Priority: SHT35 (highest accuracy) > MPL3115A2 > SCD4x > Seesaw
         if self._sensors['sht35']:
             return SensorReading(
-                lambda: round(self._sensors['sht35'].temperature, 1)
-                if self._sensors['sht35'].temperature is not None
-                else None,
+                lambda: self._smooth_temperature(
+                    round(self._sensors['sht35'].temperature, 1)
+                    if self._sensors['sht35'].temperature is not None
+                    else None),
                 "C",
                 "sht35",
             )
         elif self._sensors['mpl']:
             return SensorReading(
-                lambda: round(self._sensors['mpl'].temperature(), 1)
-                if self._sensors['mpl'].temperature() is not None
-                else None,
+                lambda: self._smooth_temperature(
+                    round(self._sensors['mpl'].temperature(), 1)
+                    if self._sensors['mpl'].temperature() is not None
+                    else None),
                 "C",
                 "mpl3115a2",
             )
         elif self._sensors['scd']:
             return SensorReading(
-                lambda: round(self._sensors['scd'].temperature, 1)
-                if self._sensors['scd'].temperature is not None
-                else None,
+                lambda: self._smooth_temperature(
+                    round(self._sensors['scd'].temperature, 1)
+                    if self._sensors['scd'].temperature is not None
+                    else None),
                 "C",
                 "scd4x",
             )
         elif self._sensors['seesaw']:
             return SensorReading(
-                lambda: round(self._sensors['seesaw'].get_temp(), 1)
-                if self._sensors['seesaw'].get_temp() is not None
-                else None,
+                lambda: self._smooth_temperature(
+                    round(self._sensors['seesaw'].get_temp(), 1)
+                    if self._sensors['seesaw'].get_temp() is not None
+                    else None),
                 "C",
                 "seesaw",
             )
@@ -363,6 +427,46 @@ class SensorManager:
             )
         return SensorReading()
 
+    def read_all(self, max_age_ms=100):
+        """Read every sensor once and return a cached SensorSnapshot.
+
+        Each sensor chip is visited a single time per snapshot, so callers
+        that need several values in the same cycle (temperature, humidity,
+        power, ...) trigger one I2C sweep instead of one per accessor.
+        Snapshots are memoized for max_age_ms milliseconds; within that
+        window repeat calls return the same object with no bus traffic.
+        """
+        now = time.ticks_ms()
+        if (self._snapshot is not None and
+                time.ticks_diff(now, self._snapshot_ms) < max_age_ms):
+            return self._snapshot
+
+        self._snapshot = SensorSnapshot(
+            self.temperature(),
+            self.humidity(),
+            self.co2(),
+            self.pressure(),
+            self.lux(),
+            self.voltage(),
+            self.current(),
+            self.power(),
+            self.fan_speed(),
+            self.moisture(),
+        )
+        self._snapshot_ms = now
+        return self._snapshot
+
+    def all_values(self):
+        """Get all sensor readings as a flat tuple in SCHEMA order.
+
+        Unlike the `all` dict this allocates no per-call dictionary;
+        iterate it with zip(SCHEMA, sensor.all_values()).
+        """
+        snap = self.read_all()
+        return (snap.temperature, snap.humidity, snap.co2, snap.pressure,
+                snap.lux, snap.voltage, snap.current, snap.power,
+                snap.fan_speed, snap.moisture)
+
     @property
     def all(self):
         """Get all sensor readings as a dictionary."""
@@ -542,6 +646,11 @@ class SensorManager:
         """Direct access to SCD4X sensor for advanced operations."""
         return self._sensors.get('scd')
 
+    @property
+    def ina(self):
+        """Direct access to INA219 sensor for advanced operations."""
+        return self._sensors.get('ina')
+
     def cleanup(self):
         """Clean up sensor resources (memory management only - boot.py handles SCD4X)."""
         try:
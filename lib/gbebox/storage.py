@@ -8,7 +8,7 @@ import uos
 import json
 from drivers import sdcard
 from machine import Pin
-from .hardware import board, spi0
+from .hardware import pins, spi0
 
 
 class SDCardManager:
@@ -20,7 +20,7 @@ class SDCardManager:
     """
     
     def __init__(self):
-        self._detect_pin = Pin(board["pins"]["sdcard_cd"], Pin.IN, Pin.PULL_UP)
+        self._detect_pin = Pin(pins.sdcard_cd, Pin.IN, Pin.PULL_UP)
         
         # Cached configuration files
         self._wifi_config = None
@@ -111,7 +111,7 @@ class SDCardManager:
                     import time 
                     time.sleep(0.2 * attempt)  # Progressive delay
                 
-                card = sdcard.SDCard(spi0, Pin(board["pins"]["spi0_cs_sdcard"]))
+                card = sdcard.SDCard(spi0, Pin(pins.spi0_cs_sdcard))
                 vfs = uos.VfsFat(card)
                 uos.mount(vfs, '/sd')
                 self._mount_state = True
@@ -0,0 +1,21 @@
+# MicroPython firmware manifest for the GBE control box (optional).
+#
+# Normal deployment copies the .py files straight to the Pico W
+# filesystem and needs no build step. For fleet builds, this manifest
+# lets the same code be frozen into a custom firmware image instead:
+# frozen modules import without parsing .py source and their bytecode
+# executes from flash rather than a RAM heap copy, which shortens cold
+# start and frees heap for logging and uploads.
+#
+# Build (from a micropython checkout, RPI_PICO_W board):
+#   make -C ports/rp2 BOARD=RPI_PICO_W FROZEN_MANIFEST=/path/to/manifest.py
+#
+# boot.py, main.py, board.json, version.txt, and the defaults/ templates
+# stay on the filesystem so they remain editable per device.
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+package("gbebox", base_path="lib")
+package("application", base_path="lib")
+package("drivers", base_path="lib")
+package("json_utils", base_path="lib")